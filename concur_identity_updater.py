@@ -14,9 +14,34 @@ Requirements:
 import requests
 import json
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode a request body as UTF-8 JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_loads(content: Union[bytes, str]) -> Any:
+    """Decode a JSON response body, using orjson when installed
+    
+    Decode errors are raised as requests' JSONDecodeError, as Response.json() does.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    except json.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
 
 class ConcurIdentityManager:
     """SAP Concur Identity v4 API Manager"""
@@ -53,7 +78,7 @@ class ConcurIdentityManager:
             response = requests.post(auth_url, data=data, headers=headers)
             response.raise_for_status()
             
-            token_data = response.json()
+            token_data = _json_loads(response.content)
             self.access_token = token_data['access_token']
             self.geolocation = token_data['geolocation']
             
@@ -95,7 +120,7 @@ class ConcurIdentityManager:
             response = requests.get(url, params=params, headers=self.get_auth_headers())
             response.raise_for_status()
             
-            users_data = response.json()
+            users_data = _json_loads(response.content)
             
             if 'Resources' in users_data and len(users_data['Resources']) > 0:
                 user_data = users_data['Resources'][0]
@@ -153,7 +178,7 @@ class ConcurIdentityManager:
             response = requests.get(url, headers=self.get_auth_headers())
             response.raise_for_status()
             
-            identity_data = response.json()
+            identity_data = _json_loads(response.content)
             
             print("✅ User identity retrieved successfully!")
             print(f"📛 Display Name: {identity_data.get('displayName', 'N/A')}")
@@ -267,10 +292,10 @@ class ConcurIdentityManager:
         
         try:
             print("\n🚀 Sending PATCH request...")
-            response = requests.patch(url, json=patch_data, headers=self.get_auth_headers())
+            response = requests.patch(url, data=_json_dumps(patch_data), headers=self.get_auth_headers())
             response.raise_for_status()
             
-            updated_data = response.json()
+            updated_data = _json_loads(response.content)
             
             print("✅ User information updated successfully!")
             print(f"📛 New Display Name: {updated_data.get('displayName', 'N/A')}")
@@ -288,7 +313,7 @@ class ConcurIdentityManager:
                 
                 # Try to parse and display SCIM error details
                 try:
-                    error_data = e.response.json()
+                    error_data = _json_loads(e.response.content)
                     if 'detail' in error_data:
                         print(f"Error detail: {error_data['detail']}")
                     if 'urn:ietf:params:scim:api:messages:concur:2.0:Error' in error_data:
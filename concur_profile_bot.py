@@ -10,6 +10,7 @@ with Identity v4 + Travel Profile v2 architecture.
 import os
 import sys
 import json
+import logging
 import anthropic
 import argparse
 from datetime import datetime, date
@@ -27,7 +28,8 @@ from concur_profile_sdk import (
     AddressType, PhoneType, EmailType, LoyaltyProgramType, VisaType,
     SeatPreference, SeatSection, MealType, HotelRoomType, SmokingPreference,
     CarType, TransmissionType,
-    ConcurProfileError, AuthenticationError, ProfileNotFoundError, ValidationError
+    ConcurProfileError, AuthenticationError, ProfileNotFoundError, ValidationError,
+    TTLCache
 )
 
 # Load credentials from .env file
@@ -48,6 +50,36 @@ MODEL_ID = "claude-3-5-sonnet-20241022"  # Use the latest stable model
 # Initialize the SDK
 sdk = None
 user_context = None  # Store current user context
+# login_id -> TravelProfile from the last get_travel_profile call. Entries expire after a
+# minute so edits made outside the bot are not hidden; a missing entry means "send the update"
+_profile_cache = TTLCache(maxsize=256, ttl=60)
+
+# Tool input keys mapped to the preference attributes they set
+AIR_INPUT_ATTRS = {
+    "air_seat_preference": "seat_preference",
+    "air_seat_section": "seat_section",
+    "air_meal_preference": "meal_preference",
+    "air_home_airport": "home_airport",
+    "air_other": "air_other"
+}
+HOTEL_INPUT_ATTRS = {
+    "hotel_room_type": "room_type",
+    "hotel_other": "hotel_other",
+    "hotel_prefer_foam_pillows": "prefer_foam_pillows",
+    "hotel_prefer_crib": "prefer_crib",
+    "hotel_prefer_rollaway_bed": "prefer_rollaway_bed",
+    "hotel_prefer_gym": "prefer_gym",
+    "hotel_prefer_pool": "prefer_pool",
+    "hotel_prefer_room_service": "prefer_room_service",
+    "hotel_prefer_early_checkin": "prefer_early_checkin"
+}
+CAR_INPUT_ATTRS = {
+    "car_type": "car_type",
+    "car_transmission": "transmission",
+    "car_smoking_preference": "smoking_preference",
+    "car_gps": "gps",
+    "car_ski_rack": "ski_rack"
+}
 
 def initialize_sdk():
     """Initialize the modern Concur SDK with Identity v4 + Travel Profile v2"""
@@ -585,6 +617,102 @@ def get_current_user_login_id():
         print(f"Error getting current user login ID: {e}")
         return None
 
+# Error message formats keyed by exception type
+_ERR_FORMATTERS = {
+    ProfileNotFoundError: "Profile not found: {}",
+    ValidationError: "Validation error: {}",
+    AuthenticationError: "Authentication error: {}",
+    ConcurProfileError: "Concur API error: {}"
+}
+
+def format_tool_error(error):
+    """Format a tool failure using the message registered for its exception type"""
+    fmt = _ERR_FORMATTERS.get(type(error))
+    if fmt is None:
+        # Subclasses without their own entry fall back to the nearest mapped base
+        fmt = next((_ERR_FORMATTERS[cls] for cls in type(error).__mro__ if cls in _ERR_FORMATTERS), "Unexpected error: {}")
+    return fmt.format(error)
+
+def preferences_unchanged(current, updated, input_attrs, tool_input):
+    """Check whether every preference given in tool_input already matches the cached section"""
+    if current is None:
+        return False
+    return all(
+        getattr(current, attr) == getattr(updated, attr)
+        for key, attr in input_attrs.items() if key in tool_input
+    )
+
+def documents_unchanged(current_documents, document):
+    """Check whether an identical document is already on the cached profile"""
+    return document in current_documents
+
+def travel_profile_to_json(travel_profile):
+    """Serialize a TravelProfile straight to the JSON string used as tool result content"""
+    air = travel_profile.air_preferences
+    hotel = travel_profile.hotel_preferences
+    car = travel_profile.car_preferences
+    tsa = travel_profile.tsa_info
+
+    # The SDK enums subclass str, so json writes a member as its value without the .value lookup
+    return json.dumps({
+        "login_id": travel_profile.login_id,
+        "rule_class": travel_profile.rule_class,
+        "travel_config_id": travel_profile.travel_config_id,
+        "air_preferences": {
+            "seat_preference": air.seat_preference or None,
+            "seat_section": air.seat_section or None,
+            "meal_preference": air.meal_preference or None,
+            "home_airport": air.home_airport,
+            "air_other": air.air_other
+        } if air else None,
+        "hotel_preferences": {
+            "room_type": hotel.room_type or None,
+            "hotel_other": hotel.hotel_other,
+            "prefer_foam_pillows": hotel.prefer_foam_pillows,
+            "prefer_gym": hotel.prefer_gym,
+            "prefer_pool": hotel.prefer_pool,
+            "prefer_room_service": hotel.prefer_room_service,
+            "prefer_early_checkin": hotel.prefer_early_checkin
+        } if hotel else None,
+        "car_preferences": {
+            "car_type": car.car_type or None,
+            "transmission": car.transmission or None,
+            "smoking_preference": car.smoking_preference or None,
+            "gps": car.gps,
+            "ski_rack": car.ski_rack
+        } if car else None,
+        "loyalty_programs": [
+            {
+                "program_type": lp.program_type,
+                "vendor_code": lp.vendor_code,
+                "account_number": lp.account_number,
+                "status": lp.status,
+                "status_benefits": lp.status_benefits,
+                "point_total": lp.point_total,
+                "segment_total": lp.segment_total
+            } for lp in travel_profile.loyalty_programs
+        ],
+        "passports": [
+            {
+                "doc_number": passport.doc_number,
+                "nationality": passport.nationality,
+                "issue_country": passport.issue_country,
+                "issue_date": passport.issue_date.isoformat() if passport.issue_date else None,
+                "expiration_date": passport.expiration_date.isoformat() if passport.expiration_date else None
+            } for passport in travel_profile.passports
+        ],
+        "tsa_info": {
+            "known_traveler_number": tsa.known_traveler_number,
+            "gender": tsa.gender,
+            "redress_number": tsa.redress_number,
+            "no_middle_name": tsa.no_middle_name
+        } if tsa else None
+    })
+
+def encode_tool_output(output):
+    """Return tool output as a JSON string, skipping outputs that are already serialized"""
+    return output if isinstance(output, str) else json.dumps(output)
+
 def tool_handler(tool_calls):
     """Handle tool calls from Claude using the modern SDK with Identity v4 + Travel Profile v2"""
     if not sdk:
@@ -654,62 +782,10 @@ def tool_handler(tool_calls):
                     result = {"error": "Login ID is required for travel profile access"}
                 else:
                     travel_profile = sdk.get_travel_profile(login_id)
+                    _profile_cache.set(login_id, travel_profile)
                     
-                    # Convert travel profile to dictionary
-                    result = {
-                        "login_id": travel_profile.login_id,
-                        "rule_class": travel_profile.rule_class,
-                        "travel_config_id": travel_profile.travel_config_id,
-                        "air_preferences": {
-                            "seat_preference": travel_profile.air_preferences.seat_preference.value if travel_profile.air_preferences and travel_profile.air_preferences.seat_preference else None,
-                            "seat_section": travel_profile.air_preferences.seat_section.value if travel_profile.air_preferences and travel_profile.air_preferences.seat_section else None,
-                            "meal_preference": travel_profile.air_preferences.meal_preference.value if travel_profile.air_preferences and travel_profile.air_preferences.meal_preference else None,
-                            "home_airport": travel_profile.air_preferences.home_airport if travel_profile.air_preferences else None,
-                            "air_other": travel_profile.air_preferences.air_other if travel_profile.air_preferences else None
-                        } if travel_profile.air_preferences else None,
-                        "hotel_preferences": {
-                            "room_type": travel_profile.hotel_preferences.room_type.value if travel_profile.hotel_preferences and travel_profile.hotel_preferences.room_type else None,
-                            "hotel_other": travel_profile.hotel_preferences.hotel_other if travel_profile.hotel_preferences else None,
-                            "prefer_foam_pillows": travel_profile.hotel_preferences.prefer_foam_pillows if travel_profile.hotel_preferences else None,
-                            "prefer_gym": travel_profile.hotel_preferences.prefer_gym if travel_profile.hotel_preferences else None,
-                            "prefer_pool": travel_profile.hotel_preferences.prefer_pool if travel_profile.hotel_preferences else None,
-                            "prefer_room_service": travel_profile.hotel_preferences.prefer_room_service if travel_profile.hotel_preferences else None,
-                            "prefer_early_checkin": travel_profile.hotel_preferences.prefer_early_checkin if travel_profile.hotel_preferences else None
-                        } if travel_profile.hotel_preferences else None,
-                        "car_preferences": {
-                            "car_type": travel_profile.car_preferences.car_type.value if travel_profile.car_preferences and travel_profile.car_preferences.car_type else None,
-                            "transmission": travel_profile.car_preferences.transmission.value if travel_profile.car_preferences and travel_profile.car_preferences.transmission else None,
-                            "smoking_preference": travel_profile.car_preferences.smoking_preference.value if travel_profile.car_preferences and travel_profile.car_preferences.smoking_preference else None,
-                            "gps": travel_profile.car_preferences.gps if travel_profile.car_preferences else None,
-                            "ski_rack": travel_profile.car_preferences.ski_rack if travel_profile.car_preferences else None
-                        } if travel_profile.car_preferences else None,
-                        "loyalty_programs": [
-                            {
-                                "program_type": lp.program_type.value,
-                                "vendor_code": lp.vendor_code,
-                                "account_number": lp.account_number,
-                                "status": lp.status,
-                                "status_benefits": lp.status_benefits,
-                                "point_total": lp.point_total,
-                                "segment_total": lp.segment_total
-                            } for lp in travel_profile.loyalty_programs
-                        ],
-                        "passports": [
-                            {
-                                "doc_number": passport.doc_number,
-                                "nationality": passport.nationality,
-                                "issue_country": passport.issue_country,
-                                "issue_date": passport.issue_date.isoformat() if passport.issue_date else None,
-                                "expiration_date": passport.expiration_date.isoformat() if passport.expiration_date else None
-                            } for passport in travel_profile.passports
-                        ],
-                        "tsa_info": {
-                            "known_traveler_number": travel_profile.tsa_info.known_traveler_number,
-                            "gender": travel_profile.tsa_info.gender,
-                            "redress_number": travel_profile.tsa_info.redress_number,
-                            "no_middle_name": travel_profile.tsa_info.no_middle_name
-                        } if travel_profile.tsa_info else None
-                    }
+                    # Serialize once here; the JSON string goes straight into the tool result
+                    result = travel_profile_to_json(travel_profile)
             
             elif tool_name == "create_user_identity":
                 from concur_profile_sdk import IdentityUser, IdentityName, IdentityEmail, IdentityPhoneNumber, IdentityEnterpriseInfo
@@ -764,6 +840,7 @@ def tool_handler(tool_calls):
                     if fields_to_update:
                         try:
                             response = sdk.update_travel_profile(profile, fields_to_update=fields_to_update)
+                            _profile_cache.pop(login_id, None)
                             result = {"success": True, "message": f"Updated travel profile: {', '.join(fields_to_update)}"}
                         except Exception as update_error:
                             result = {"error": f"Failed to update travel profile: {str(update_error)}"}
@@ -777,6 +854,7 @@ def tool_handler(tool_calls):
                 else:
                     profile = TravelProfile(login_id=login_id)
                     fields_to_update = []
+                    current = _profile_cache.get(login_id)
                     
                     # Handle air preferences
                     air_fields = ["air_seat_preference", "air_seat_section", "air_meal_preference", "air_home_airport", "air_other"]
@@ -794,7 +872,8 @@ def tool_handler(tool_calls):
                             air_prefs.air_other = tool_input["air_other"]
                         
                         profile.air_preferences = air_prefs
-                        fields_to_update.append("air_preferences")
+                        if not (current and preferences_unchanged(current.air_preferences, air_prefs, AIR_INPUT_ATTRS, tool_input)):
+                            fields_to_update.append("air_preferences")
                     
                     # Handle hotel preferences
                     hotel_fields = ["hotel_room_type", "hotel_other", "hotel_prefer_foam_pillows", "hotel_prefer_crib", 
@@ -822,7 +901,8 @@ def tool_handler(tool_calls):
                             hotel_prefs.prefer_early_checkin = tool_input["hotel_prefer_early_checkin"]
                         
                         profile.hotel_preferences = hotel_prefs
-                        fields_to_update.append("hotel_preferences")
+                        if not (current and preferences_unchanged(current.hotel_preferences, hotel_prefs, HOTEL_INPUT_ATTRS, tool_input)):
+                            fields_to_update.append("hotel_preferences")
                     
                     # Handle car preferences
                     car_fields = ["car_type", "car_transmission", "car_smoking_preference", "car_gps", "car_ski_rack"]
@@ -840,14 +920,19 @@ def tool_handler(tool_calls):
                             car_prefs.ski_rack = tool_input["car_ski_rack"]
                         
                         profile.car_preferences = car_prefs
-                        fields_to_update.append("car_preferences")
+                        if not (current and preferences_unchanged(current.car_preferences, car_prefs, CAR_INPUT_ATTRS, tool_input)):
+                            fields_to_update.append("car_preferences")
                     
                     if fields_to_update:
                         try:
                             response = sdk.update_travel_profile(profile, fields_to_update=fields_to_update)
+                            _profile_cache.pop(login_id, None)
                             result = {"success": True, "message": f"Updated travel preferences: {', '.join(fields_to_update)}"}
                         except Exception as update_error:
                             result = {"error": f"Failed to update travel preferences: {str(update_error)}"}
+                    elif current and any(key in tool_input for key in (*AIR_INPUT_ATTRS, *HOTEL_INPUT_ATTRS, *CAR_INPUT_ATTRS)):
+                        # Everything requested already matches the cached profile
+                        result = {"success": True, "message": "no changes"}
                     else:
                         result = {"error": "No travel preferences provided to update"}
             
@@ -860,6 +945,8 @@ def tool_handler(tool_calls):
                 else:
                     profile = TravelProfile(login_id=login_id)
                     fields_to_update = []
+                    documents_requested = False
+                    current = _profile_cache.get(login_id)
                     
                     # Handle passport updates
                     if any(field in tool_input for field in ["passport_number", "passport_nationality", "passport_issue_country", "passport_issue_date", "passport_expiration_date"]):
@@ -879,7 +966,9 @@ def tool_handler(tool_calls):
                             expiration_date=expiration_date
                         )
                         profile.passports = [passport]
-                        fields_to_update.append("passports")
+                        documents_requested = True
+                        if not (current and documents_unchanged(current.passports, passport)):
+                            fields_to_update.append("passports")
                     
                     # Handle visa updates
                     if any(field in tool_input for field in ["visa_nationality", "visa_number", "visa_type", "visa_country_issued"]):
@@ -890,7 +979,9 @@ def tool_handler(tool_calls):
                             visa_country_issued=tool_input.get("visa_country_issued", "")
                         )
                         profile.visas = [visa]
-                        fields_to_update.append("visas")
+                        documents_requested = True
+                        if not (current and documents_unchanged(current.visas, visa)):
+                            fields_to_update.append("visas")
                     
                     # Handle national ID updates
                     if any(field in tool_input for field in ["national_id_number", "national_id_country"]):
@@ -899,7 +990,9 @@ def tool_handler(tool_calls):
                             country_code=tool_input.get("national_id_country", "")
                         )
                         profile.national_ids = [national_id]
-                        fields_to_update.append("national_ids")
+                        documents_requested = True
+                        if not (current and documents_unchanged(current.national_ids, national_id)):
+                            fields_to_update.append("national_ids")
                     
                     # Handle driver's license updates
                     if any(field in tool_input for field in ["drivers_license_number", "drivers_license_country", "drivers_license_state"]):
@@ -909,11 +1002,17 @@ def tool_handler(tool_calls):
                             state_province=tool_input.get("drivers_license_state", "")
                         )
                         profile.drivers_licenses = [drivers_license]
-                        fields_to_update.append("drivers_licenses")
+                        documents_requested = True
+                        if not (current and documents_unchanged(current.drivers_licenses, drivers_license)):
+                            fields_to_update.append("drivers_licenses")
                     
                     if fields_to_update:
                         response = sdk.update_travel_profile(profile, fields_to_update=fields_to_update)
+                        _profile_cache.pop(login_id, None)
                         result = {"success": True, "message": f"Updated identity documents: {', '.join(fields_to_update)}"}
+                    elif documents_requested:
+                        # Every document sent is already on the cached profile
+                        result = {"success": True, "message": "no changes"}
                     else:
                         result = {"error": "No identity document information provided to update"}
             
@@ -941,6 +1040,7 @@ def tool_handler(tool_calls):
                 )
                 
                 response = sdk.update_loyalty_program(loyalty_program, login_id)
+                _profile_cache.pop(login_id, None)
                 if response.success:
                     result = {"success": True, "message": f"Updated {tool_input['vendor_code']} loyalty program"}
                 else:
@@ -973,16 +1073,8 @@ def tool_handler(tool_calls):
             else:
                 result = {"error": f"Unknown tool: {tool_name}"}
         
-        except ProfileNotFoundError as e:
-            result = {"error": f"Profile not found: {str(e)}"}
-        except ValidationError as e:
-            result = {"error": f"Validation error: {str(e)}"}
-        except AuthenticationError as e:
-            result = {"error": f"Authentication error: {str(e)}"}
-        except ConcurProfileError as e:
-            result = {"error": f"Concur API error: {str(e)}"}
         except Exception as e:
-            result = {"error": f"Unexpected error: {str(e)}"}
+            result = {"error": format_tool_error(e)}
         
         tool_results.append({
             "tool_call_id": tool_call_id,
@@ -1035,11 +1127,11 @@ def chat_with_claude():
                 
                 # Check for tool calls
                 tool_calls = []
-                content_text = ""
+                text_parts = []
                 
                 for content_block in response.content:
                     if content_block.type == "text":
-                        content_text += content_block.text
+                        text_parts.append(content_block.text)
                     elif content_block.type == "tool_use":
                         tool_calls.append({
                             "id": content_block.id,
@@ -1048,6 +1140,8 @@ def chat_with_claude():
                         })
                         print(f"\n[Using SDK tool: {content_block.name}]")
                 
+                content_text = "".join(text_parts)
+                
                 # Print Claude's text response
                 if content_text:
                     print(f"\nAssistant: {content_text}")
@@ -1066,7 +1160,7 @@ def chat_with_claude():
                     tool_result_content.append({
                         "type": "tool_result",
                         "tool_use_id": result["tool_call_id"],
-                        "content": json.dumps(result["output"])
+                        "content": encode_tool_output(result["output"])
                     })
                 
                 messages.append({
@@ -1080,6 +1174,9 @@ def chat_with_claude():
 
 def main():
     """Main entry point with command-line interface"""
+    # The SDK no longer configures logging itself; keep its INFO output on the console
+    logging.basicConfig(level=logging.INFO)
+    
     parser = argparse.ArgumentParser(description='Concur Profile Bot powered by Claude + Modern SDK (Identity v4 + Travel Profile v2)')
     
     # Mode selection
@@ -1219,11 +1316,11 @@ def main():
             
             # Check for tool calls
             tool_calls = []
-            content_text = ""
+            text_parts = []
             
             for content_block in response.content:
                 if content_block.type == "text":
-                    content_text += content_block.text
+                    text_parts.append(content_block.text)
                 elif content_block.type == "tool_use":
                     tool_calls.append({
                         "id": content_block.id,
@@ -1232,6 +1329,8 @@ def main():
                     })
                     print(f"\n[Using SDK tool: {content_block.name}]")
             
+            content_text = "".join(text_parts)
+            
             # Print Claude's text response
             if content_text:
                 print(f"\nClaude: {content_text}")
@@ -1250,7 +1349,7 @@ def main():
                 tool_result_content.append({
                     "type": "tool_result",
                     "tool_use_id": result["tool_call_id"],
-                    "content": json.dumps(result["output"])
+                    "content": encode_tool_output(result["output"])
                 })
             
             messages.append({
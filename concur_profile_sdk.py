@@ -7,23 +7,188 @@ A comprehensive SDK for interacting with SAP Concur's APIs:
 - Travel Profile v2 for travel preferences, loyalty programs, and travel-specific data
 """
 
+from __future__ import annotations
+
 import requests
-from lxml import etree
-from typing import Dict, List, Optional, Union, TypedDict, Literal, Any
-from datetime import datetime, timedelta, date
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import importlib
+import base64
+import calendar
+import functools
+import itertools
+import operator
+from typing import Dict, List, Optional, Tuple, Union, TypedDict, Any
+from datetime import datetime, date
 from enum import Enum
 import logging
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+from collections import OrderedDict
+import io
 import json
 import re
-import base64
-import urllib.parse
+from xml.sax.saxutils import escape
 import time
+import threading
 import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+
+class _LazyModule:
+    """Proxy that imports a module (or one of its attributes) on first use
+    
+    Identity v4 callers never touch XML, so lxml is only loaded once a
+    Travel Profile method needs it. Resolved attributes are cached on the
+    proxy so later lookups skip __getattr__.
+    """
+    
+    def __init__(self, module_name: str, attr: Optional[str] = None):
+        self._module_name = module_name
+        self._attr = attr
+        self._target = None
+    
+    def _load(self) -> Any:
+        if self._target is None:
+            target = importlib.import_module(self._module_name)
+            if self._attr:
+                target = getattr(target, self._attr)
+            self._target = target
+        return self._target
+    
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._load(), name)
+        setattr(self, name, value)
+        return value
+    
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._load()(*args, **kwargs)
+
+
+etree = _LazyModule("lxml.etree")
+
+try:
+    import httpx
+except ImportError:  # async API methods are unavailable without httpx
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
+
+try:
+    import pybase64
+except ImportError:  # JWT payloads decode with the stdlib base64 module
+    pybase64 = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library logger - handlers and levels are left to the application; the NullHandler
+# keeps unconfigured hosts from getting logging's last-resort stderr output
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+def _json_default(value: Any) -> Any:
+    """Serialize dates for the stdlib json fallback the way orjson does"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode a request body as UTF-8 JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC)
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+
+def _xml_text(xml_data: Union[bytes, str]) -> str:
+    """Response XML as str, decoding UTF-8 bytes only when needed"""
+    return xml_data if isinstance(xml_data, str) else xml_data.decode("utf-8")
+
+
+def _xml_bytes(xml_data: Union[bytes, str]) -> bytes:
+    """Response XML as bytes, encoding str only when needed"""
+    return xml_data if isinstance(xml_data, bytes) else xml_data.encode("utf-8")
+
+
+# One parser per thread: an lxml parser serializes concurrent parses on an internal lock
+_parser_local = threading.local()
+
+
+def _response_parser() -> "etree.XMLParser":
+    """This thread's parser for Concur responses, built on first use so lxml stays lazy
+    
+    Entities are not expanded and nothing is fetched from the network, so
+    hostile responses cannot trigger entity-expansion or external-entity attacks.
+    """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = etree.XMLParser(
+            remove_blank_text=True, collect_ids=False, resolve_entities=False,
+            no_network=True, huge_tree=False
+        )
+    return parser
+
+
+def _pretty_xml(xml_data: bytes) -> str:
+    """Indent an outgoing XML body for debug logging, exactly as it will be sent"""
+    return etree.tostring(etree.fromstring(xml_data, _response_parser()), pretty_print=True, encoding="unicode")
+
+
+def _json_loads(content: Union[bytes, str]) -> Any:
+    """Decode a JSON response body, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Extra entities for attribute values in the string-based XML writers
+_ATTR_ENTITIES = {'"': "&quot;"}
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_cached(value: str) -> str:
+    """escape() memoized; bulk updates repeat the same company and vendor names"""
+    return escape(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_attr_cached(value: str) -> str:
+    """escape() with the attribute entities, memoized like _escape_cached"""
+    return escape(value, _ATTR_ENTITIES)
+
+
+def _escape_text(value: str) -> str:
+    """escape() for element text; most values need no escaping, so skip the replace passes"""
+    if "&" in value or "<" in value or ">" in value:
+        return _escape_cached(value)
+    return value
+
+
+def _escape_attr(value: str) -> str:
+    """escape() for double-quoted attribute values, with the same clean-value fast path"""
+    if "&" in value or "<" in value or ">" in value or '"' in value:
+        return _escape_attr_cached(value)
+    return value
+
+
+def _create_session() -> requests.Session:
+    """Create a session with a pooled, retrying HTTPS adapter for the Concur endpoints"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=100,
+        # 429 waits out the server's Retry-After before the next attempt. Once retries run
+        # out the last response is returned, so callers still see its status code and body
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+                          raise_on_status=False)
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by every ConcurSDK created without its own session
+_session = _create_session()
 
 
 # Identity v4 Types and Enums
@@ -33,6 +198,7 @@ class SCIMSchemas(str, Enum):
     ENTERPRISE_USER = "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"
     CONCUR_USER = "urn:ietf:params:scim:schemas:extension:concur:2.0:User"
     PATCH_OP = "urn:ietf:params:scim:api:messages:2.0:PatchOp"
+    BULK_REQUEST = "urn:ietf:params:scim:api:messages:2.0:BulkRequest"
 
 
 class IdentityResourceType(str, Enum):
@@ -202,8 +368,198 @@ class AuthResponse(TypedDict):
     id_token: str
 
 
+# Refresh tokens this many seconds early so clock skew never lets a request carry an expired token
+_TOKEN_EXPIRY_SLOP = 300
+# Headers for every token request, sync or async - treat as read-only
+_AUTH_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "concur-correlationid": "python-concur-sdk"
+}
+
+
+@dataclass(slots=True)
+class TokenCache:
+    """Access token with expiry deadlines on the monotonic clock"""
+    access_token: str
+    expires_at: float
+    refresh_token: str = ""
+    refresh_expires_at: float = 0.0
+    
+    @classmethod
+    def from_auth_response(cls, auth_data: AuthResponse) -> TokenCache:
+        """Build a cache entry, pulling both deadlines in by the expiry slop"""
+        now = time.monotonic()
+        return cls(
+            access_token=auth_data["access_token"],
+            expires_at=now + auth_data["expires_in"] - _TOKEN_EXPIRY_SLOP,
+            refresh_token=auth_data.get("refresh_token", ""),
+            refresh_expires_at=now + auth_data.get("refresh_expires_in", 0) - _TOKEN_EXPIRY_SLOP
+        )
+    
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+# Enum values looked up once for the serializers (none need XML escaping)
+_CORE_USER = SCIMSchemas.CORE_USER.value
+_ENTERPRISE_USER = SCIMSchemas.ENTERPRISE_USER.value
+_PATCH_OP = SCIMSchemas.PATCH_OP.value
+_BULK_REQUEST = SCIMSchemas.BULK_REQUEST.value
+# Shared by every to_create_dict result - treat as read-only
+_CREATE_SCHEMAS = [_CORE_USER, _ENTERPRISE_USER]
+_UPDATE_ACTION = ProfileAction.UPDATE.value
+# Boolean element text indexed by the flag, so the writers don't branch per field
+_BOOL_TEXT = ("false", "true")
+_XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+# Shared by every legacy update tree - treat as read-only
+_PROFILE_NSMAP = {"xsi": _XSI_NAMESPACE}
+# Fixed start of every update document; only the LoginId value varies per profile
+_UPDATE_ROOT_PREFIX = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    f'<ProfileResponse xmlns:xsi="{_XSI_NAMESPACE}" Action="{_UPDATE_ACTION}" LoginId="'
+)
+# XML text of every enum member the writers emit; members with equal values share an entry
+_ENUM_TEXT = {
+    member: member.value
+    for enum_type in (
+        AddressType, PhoneType, EmailType, VisaType, SeatPreference, SeatSection,
+        MealType, HotelRoomType, SmokingPreference, CarType, TransmissionType,
+        LoyaltyProgramType
+    )
+    for member in enum_type
+}
+# Response text -> enum member for the readers, so unknown text is a dict miss rather than a ValueError
+_VISA_TYPES = {member.value: member for member in VisaType}
+_SEAT_PREFERENCES = {member.value: member for member in SeatPreference}
+_SEAT_SECTIONS = {member.value: member for member in SeatSection}
+_MEAL_TYPES = {member.value: member for member in MealType}
+_HOTEL_ROOM_TYPES = {member.value: member for member in HotelRoomType}
+_CAR_TYPES = {member.value: member for member in CarType}
+_TRANSMISSION_TYPES = {member.value: member for member in TransmissionType}
+_SMOKING_PREFERENCES = {member.value: member for member in SmokingPreference}
+_PROFILE_STATUSES = {member.value: member for member in ProfileStatus}
+# Membership VendorType text uses the LoyaltyProgramType values (Air, Hotel, Car, Rail)
+_LOYALTY_PROGRAM_TYPES = {member.value: member for member in LoyaltyProgramType}
+
+# Root start tag of a Travel Profile write response: tag name and raw attribute text.
+# Attribute values containing entities do not match and take the lxml path.
+_RESPONSE_ROOT_RE = re.compile(
+    r"\s*(?:<\?xml[^>]*\?>\s*)?<([A-Za-z_][\w.-]*)"
+    r"((?:\s+[\w.:-]+\s*=\s*(?:\"[^\"<&]*\"|'[^'<&]*'))*)\s*/?>"
+)
+_RESPONSE_ATTR_RE = re.compile(r"([\w.:-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+# Responses longer than this always get a full parse
+_FAST_RESPONSE_MAX_LEN = 512
+
+# Loose email address shape check, compiled once at import
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+# YYYY-M-D with optional zero padding, the date forms the profile parser accepts
+_ISO_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
+# ISO 3166-1 alpha-2 country codes accepted by the Travel Profile schema, plus the
+# user-assigned XK (Kosovo) that travel systems use in its place
+_ISO_3166_1_A2: frozenset = frozenset({
+    "AD", "AE", "AF", "AG", "AI", "AL", "AM", "AO", "AQ", "AR", "AS", "AT", "AU", "AW", "AX", "AZ",
+    "BA", "BB", "BD", "BE", "BF", "BG", "BH", "BI", "BJ", "BL", "BM", "BN", "BO", "BQ", "BR", "BS",
+    "BT", "BV", "BW", "BY", "BZ", "CA", "CC", "CD", "CF", "CG", "CH", "CI", "CK", "CL", "CM", "CN",
+    "CO", "CR", "CU", "CV", "CW", "CX", "CY", "CZ", "DE", "DJ", "DK", "DM", "DO", "DZ", "EC", "EE",
+    "EG", "EH", "ER", "ES", "ET", "FI", "FJ", "FK", "FM", "FO", "FR", "GA", "GB", "GD", "GE", "GF",
+    "GG", "GH", "GI", "GL", "GM", "GN", "GP", "GQ", "GR", "GS", "GT", "GU", "GW", "GY", "HK", "HM",
+    "HN", "HR", "HT", "HU", "ID", "IE", "IL", "IM", "IN", "IO", "IQ", "IR", "IS", "IT", "JE", "JM",
+    "JO", "JP", "KE", "KG", "KH", "KI", "KM", "KN", "KP", "KR", "KW", "KY", "KZ", "LA", "LB", "LC",
+    "LI", "LK", "LR", "LS", "LT", "LU", "LV", "LY", "MA", "MC", "MD", "ME", "MF", "MG", "MH", "MK",
+    "ML", "MM", "MN", "MO", "MP", "MQ", "MR", "MS", "MT", "MU", "MV", "MW", "MX", "MY", "MZ", "NA",
+    "NC", "NE", "NF", "NG", "NI", "NL", "NO", "NP", "NR", "NU", "NZ", "OM", "PA", "PE", "PF", "PG",
+    "PH", "PK", "PL", "PM", "PN", "PR", "PS", "PT", "PW", "PY", "QA", "RE", "RO", "RS", "RU", "RW",
+    "SA", "SB", "SC", "SD", "SE", "SG", "SH", "SI", "SJ", "SK", "SL", "SM", "SN", "SO", "SR", "SS",
+    "ST", "SV", "SX", "SY", "SZ", "TC", "TD", "TF", "TG", "TH", "TJ", "TK", "TL", "TM", "TN", "TO",
+    "TR", "TT", "TV", "TW", "TZ", "UA", "UG", "UM", "US", "UY", "UZ", "VA", "VC", "VE", "VG", "VI",
+    "VN", "VU", "WF", "WS", "XK", "YE", "YT", "ZA", "ZM", "ZW"
+})
+
+
+def _validate_country_code(value: str, field_name: str) -> None:
+    """Reject non-empty country codes that are not ISO 3166-1 alpha-2, in either case"""
+    if value and value.upper() not in _ISO_3166_1_A2:
+        raise ValidationError(f"Invalid {field_name}: {value!r} is not an ISO 3166-1 alpha-2 country code")
+
+
+def _validate_email(value: str) -> None:
+    """Reject non-empty email addresses that do not match _EMAIL_RE"""
+    if value and not _EMAIL_RE.fullmatch(value):
+        raise ValidationError(f"Invalid email address: {value!r}")
+
+
+# Separators allowed in phone numbers, stripped before the digit check
+_PHONE_SEPARATORS = str.maketrans("", "", " -+().")
+
+
+def _validate_phone_number(value: str) -> None:
+    """Reject non-empty phone numbers holding anything but digits and separators"""
+    if value and not value.translate(_PHONE_SEPARATORS).isdigit():
+        raise ValidationError(f"Invalid phone number: {value!r}")
+
+
+# TSA gender values accepted by the schema plus single letter codes, keyed by upper-case input
+_TSA_GENDER_MAP = {
+    "M": "Male",
+    "F": "Female",
+    "MALE": "Male",
+    "FEMALE": "Female",
+    "UNDISCLOSED": "Undisclosed",
+    "UNKNOWN": "Unknown",
+    "UNSPECIFIED": "Unspecified"
+}
+# Schema spellings map to themselves, so values read back from a profile skip upper()
+_TSA_GENDER_MAP.update({text: text for text in _TSA_GENDER_MAP.values()})
+
+
+def _tsa_gender_text(gender: str) -> str:
+    """Schema Gender text for a TSA gender value, case-insensitive, "Unknown" when unrecognized"""
+    text = _TSA_GENDER_MAP.get(gender)
+    if text is None:
+        text = _TSA_GENDER_MAP.get(gender.upper(), "Unknown")
+    return text
+
+
+def _add_text_children(parent: etree._Element, obj: Any, fields: Tuple[Tuple[str, str], ...]) -> None:
+    """Add a text child for each (attribute, tag) in fields whose value on obj is non-empty
+    
+    Drives the lxml writers whose children are all optional text from a
+    class-level field table; _write_text_children reads the same table.
+    """
+    sub_element = etree.SubElement
+    for attr, tag in fields:
+        value = getattr(obj, attr)
+        if value:
+            sub_element(parent, tag).text = value
+
+
+def _add_flag_children(parent: etree._Element, obj: Any, fields: Tuple[Tuple[str, str], ...]) -> None:
+    """Add a <tag>true</tag> child for each (attribute, tag) in fields that is set on obj"""
+    sub_element = etree.SubElement
+    for attr, tag in fields:
+        if getattr(obj, attr):
+            sub_element(parent, tag).text = "true"
+
+
+def _write_text_children(out: List[str], obj: Any, fields: Tuple[Tuple[str, str], ...]) -> None:
+    """String-writer counterpart of _add_text_children, driven by the same field table"""
+    for attr, tag in fields:
+        value = getattr(obj, attr)
+        if value:
+            out.append(f"<{tag}>{_escape_text(value)}</{tag}>")
+
+
+def _write_flag_children(out: List[str], obj: Any, fields: Tuple[Tuple[str, str], ...]) -> None:
+    """String-writer counterpart of _add_flag_children, driven by the same field table"""
+    for attr, tag in fields:
+        if getattr(obj, attr):
+            out.append(f"<{tag}>true</{tag}>")
+
+
 # Identity v4 Data Classes
-@dataclass
+@dataclass(slots=True)
 class IdentityEmail:
     """Identity v4 email structure"""
     value: str
@@ -211,6 +567,10 @@ class IdentityEmail:
     primary: bool = True
     verified: bool = False
     
+    def validate(self) -> None:
+        """Raise ValidationError if the address is not email shaped"""
+        _validate_email(self.value)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "value": self.value,
@@ -220,13 +580,17 @@ class IdentityEmail:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentityPhoneNumber:
     """Identity v4 phone number structure"""
     value: str
     type: str = "work"
     primary: bool = True
     
+    def validate(self) -> None:
+        """Raise ValidationError if the number holds anything but digits and separators"""
+        _validate_phone_number(self.value)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "value": self.value,
@@ -235,7 +599,7 @@ class IdentityPhoneNumber:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentityName:
     """Identity v4 name structure"""
     given_name: str = ""
@@ -256,7 +620,7 @@ class IdentityName:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentityEnterpriseInfo:
     """Identity v4 enterprise extension"""
     company_id: str = ""
@@ -280,7 +644,7 @@ class IdentityEnterpriseInfo:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentityUser:
     """Complete Identity v4 user object"""
     user_name: str
@@ -305,30 +669,31 @@ class IdentityUser:
     id: str = ""
     external_id: str = ""
     
-    def to_create_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for user creation"""
+    def validate(self) -> None:
+        """Check the emails and phone numbers about to be sent, raising ValidationError"""
+        for email in self.emails:
+            email.validate()
+        for phone in self.phone_numbers:
+            phone.validate()
+    
+    def _attributes_dict(self) -> Dict[str, Any]:
+        """Core SCIM attributes shared by to_dict and to_create_dict"""
         user_data = {
-            "schemas": [
-                SCIMSchemas.CORE_USER.value,
-                SCIMSchemas.ENTERPRISE_USER.value
-            ],
             "userName": self.user_name,
             "active": self.active
         }
         
         # Add optional core fields
-        if self.display_name:
-            user_data["displayName"] = self.display_name
-        if self.title:
-            user_data["title"] = self.title
-        if self.nick_name:
-            user_data["nickName"] = self.nick_name
-        if self.preferred_language:
-            user_data["preferredLanguage"] = self.preferred_language
-        if self.timezone:
-            user_data["timezone"] = self.timezone
-        if self.external_id:
-            user_data["externalId"] = self.external_id
+        user_data.update({
+            key: value for key, value in (
+                ("displayName", self.display_name),
+                ("title", self.title),
+                ("nickName", self.nick_name),
+                ("preferredLanguage", self.preferred_language),
+                ("timezone", self.timezone),
+                ("externalId", self.external_id)
+            ) if value
+        })
         
         # Add name
         if self.name:
@@ -344,11 +709,29 @@ class IdentityUser:
         if self.phone_numbers:
             user_data["phoneNumbers"] = [phone.to_dict() for phone in self.phone_numbers]
         
+        return user_data
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary without the SCIM schema envelope"""
+        user_data = self._attributes_dict()
+        if self.id:
+            user_data["id"] = self.id
+        if self.enterprise_info:
+            enterprise_dict = self.enterprise_info.to_dict()
+            if enterprise_dict:
+                user_data["enterprise"] = enterprise_dict
+        return user_data
+    
+    def to_create_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for user creation"""
+        user_data = {"schemas": _CREATE_SCHEMAS}
+        user_data.update(self._attributes_dict())
+        
         # Add enterprise extension
         if self.enterprise_info:
             enterprise_dict = self.enterprise_info.to_dict()
             if enterprise_dict:
-                user_data[SCIMSchemas.ENTERPRISE_USER.value] = enterprise_dict
+                user_data[_ENTERPRISE_USER] = enterprise_dict
         
         return user_data
     
@@ -401,14 +784,15 @@ class IdentityUser:
             ]
         
         # Parse enterprise info
-        enterprise_key = SCIMSchemas.ENTERPRISE_USER.value
+        enterprise_key = _ENTERPRISE_USER
         if enterprise_key in data:
             enterprise_data = data[enterprise_key]
             start_date = None
-            if enterprise_data.get("startDate"):
+            start_date_str = enterprise_data.get("startDate")
+            if start_date_str and len(start_date_str) >= 10:
                 try:
-                    start_date = datetime.fromisoformat(enterprise_data["startDate"]).date()
-                except:
+                    start_date = date.fromisoformat(start_date_str[:10])
+                except ValueError:
                     pass
             
             user.enterprise_info = IdentityEnterpriseInfo(
@@ -422,7 +806,7 @@ class IdentityUser:
         return user
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     """Represents a user's address"""
     type: AddressType
@@ -432,25 +816,33 @@ class Address:
     postal_code: str = ""
     country_code: str = "US"  # ISO 2-letter code
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    # (attribute, tag) for each optional text child, in schema order
+    _TEXT_FIELDS = (
+        ("street", "Street"),
+        ("city", "City"),
+        ("state_province", "StateProvince"),
+        ("postal_code", "PostalCode"),
+        ("country_code", "CountryCode"),
+    )
+    
+    def validate(self) -> None:
+        """Raise ValidationError if the country code is not ISO 3166-1 alpha-2"""
+        _validate_country_code(self.country_code, "address country_code")
+    
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add address as XML element to parent"""
-        addr_elem = etree.SubElement(parent, "Address", Type=self.type.value)
-        
-        if self.street:
-            etree.SubElement(addr_elem, "Street").text = self.street
-        if self.city:
-            etree.SubElement(addr_elem, "City").text = self.city
-        if self.state_province:
-            etree.SubElement(addr_elem, "StateProvince").text = self.state_province
-        if self.postal_code:
-            etree.SubElement(addr_elem, "PostalCode").text = self.postal_code
-        if self.country_code:
-            etree.SubElement(addr_elem, "CountryCode").text = self.country_code
-            
+        addr_elem = etree.SubElement(parent, "Address", Type=_ENUM_TEXT[self.type])
+        _add_text_children(addr_elem, self, self._TEXT_FIELDS)
         return addr_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append address XML to out"""
+        out.append(f'<Address Type="{_ENUM_TEXT[self.type]}">')
+        _write_text_children(out, self, self._TEXT_FIELDS)
+        out.append("</Address>")
 
 
-@dataclass
+@dataclass(slots=True)
 class Phone:
     """Represents a phone number"""
     type: PhoneType
@@ -458,34 +850,51 @@ class Phone:
     country_code: str = ""
     extension: str = ""
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    # (attribute, tag) for each optional text child, in schema order
+    _TEXT_FIELDS = (("country_code", "CountryCode"), ("phone_number", "PhoneNumber"), ("extension", "Extension"))
+    
+    def validate(self) -> None:
+        """Raise ValidationError if the number holds anything but digits and separators"""
+        _validate_phone_number(self.phone_number)
+    
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add phone as XML element to parent"""
-        phone_elem = etree.SubElement(parent, "Telephone", Type=self.type.value)
-        
-        if self.country_code:
-            etree.SubElement(phone_elem, "CountryCode").text = self.country_code
-        if self.phone_number:
-            etree.SubElement(phone_elem, "PhoneNumber").text = self.phone_number
-        if self.extension:
-            etree.SubElement(phone_elem, "Extension").text = self.extension
-            
+        phone_elem = etree.SubElement(parent, "Telephone", Type=_ENUM_TEXT[self.type])
+        _add_text_children(phone_elem, self, self._TEXT_FIELDS)
         return phone_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append phone XML to out"""
+        out.append(f'<Telephone Type="{_ENUM_TEXT[self.type]}">')
+        _write_text_children(out, self, self._TEXT_FIELDS)
+        out.append("</Telephone>")
 
 
-@dataclass
+@dataclass(slots=True)
 class Email:
     """Represents an email address"""
     type: EmailType
     email_address: str
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def validate(self) -> None:
+        """Raise ValidationError if the address is not email shaped"""
+        _validate_email(self.email_address)
+    
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add email as XML element to parent"""
-        email_elem = etree.SubElement(parent, "EmailAddress", Type=self.type.value)
+        email_elem = etree.SubElement(parent, "EmailAddress", Type=_ENUM_TEXT[self.type])
         email_elem.text = self.email_address
         return email_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append email XML to out"""
+        out.append(
+            f'<EmailAddress Type="{_ENUM_TEXT[self.type]}">'
+            f"{_escape_text(self.email_address)}</EmailAddress>"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class EmergencyContact:
     """Represents an emergency contact"""
     name: str
@@ -494,14 +903,13 @@ class EmergencyContact:
     mobile_phone: str = ""
     email: str = ""
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    # Phone, MobilePhone and Email are left out, see to_xml_element
+    _TEXT_FIELDS = (("name", "Name"), ("relationship", "Relationship"))
+    
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add emergency contact as XML element to parent"""
         contact_elem = etree.SubElement(parent, "EmergencyContact")
-        
-        if self.name:
-            etree.SubElement(contact_elem, "Name").text = self.name
-        if self.relationship:
-            etree.SubElement(contact_elem, "Relationship").text = self.relationship
+        _add_text_children(contact_elem, self, self._TEXT_FIELDS)
         # NOTE: Phone and Email fields in EmergencyContact cause XML validation errors
         # during user creation. These fields require special scopes and structures.
         # They are excluded during creation and should be added via separate update operations.
@@ -513,30 +921,43 @@ class EmergencyContact:
         #     etree.SubElement(contact_elem, "Email").text = self.email
             
         return contact_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append emergency contact XML to out (Phone/Email excluded, see to_xml_element)"""
+        out.append("<EmergencyContact>")
+        _write_text_children(out, self, self._TEXT_FIELDS)
+        out.append("</EmergencyContact>")
 
 
-@dataclass
+@dataclass(slots=True)
 class NationalID:
     """Represents a national identification"""
     id_number: str
     country_code: str
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add national ID as XML element to parent"""
         id_elem = etree.SubElement(parent, "NationalID")
         etree.SubElement(id_elem, "NationalIDNumber").text = self.id_number
         etree.SubElement(id_elem, "IssuingCountry").text = self.country_code
         return id_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append national ID XML to out"""
+        out.append(
+            f"<NationalID><NationalIDNumber>{_escape_text(self.id_number)}</NationalIDNumber>"
+            f"<IssuingCountry>{_escape_text(self.country_code)}</IssuingCountry></NationalID>"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class DriversLicense:
     """Represents a driver's license"""
     license_number: str
     country_code: str
     state_province: str = ""
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add driver's license as XML element to parent"""
         license_elem = etree.SubElement(parent, "DriversLicense")
         etree.SubElement(license_elem, "DriversLicenseNumber").text = self.license_number
@@ -544,9 +965,19 @@ class DriversLicense:
         if self.state_province:
             etree.SubElement(license_elem, "IssuingState").text = self.state_province
         return license_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append driver's license XML to out"""
+        out.append(
+            f"<DriversLicense><DriversLicenseNumber>{_escape_text(self.license_number)}</DriversLicenseNumber>"
+            f"<IssuingCountry>{_escape_text(self.country_code)}</IssuingCountry>"
+        )
+        if self.state_province:
+            out.append(f"<IssuingState>{_escape_text(self.state_province)}</IssuingState>")
+        out.append("</DriversLicense>")
 
 
-@dataclass
+@dataclass(slots=True)
 class Passport:
     """Represents a passport"""
     doc_number: str
@@ -556,24 +987,41 @@ class Passport:
     expiration_date: Optional[date] = None
     primary: bool = False
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def validate(self) -> None:
+        """Raise ValidationError if either country is not ISO 3166-1 alpha-2"""
+        _validate_country_code(self.nationality, "passport nationality")
+        _validate_country_code(self.issue_country, "passport issue_country")
+    
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add passport as XML element to parent"""
         passport_elem = etree.SubElement(parent, "Passport")
-        
         etree.SubElement(passport_elem, "PassportNumber").text = self.doc_number
         etree.SubElement(passport_elem, "PassportNationality").text = self.nationality
         etree.SubElement(passport_elem, "PassportCountryIssued").text = self.issue_country
         
         if self.issue_date:
-            etree.SubElement(passport_elem, "PassportDateIssued").text = self.issue_date.strftime("%Y-%m-%d")
+            etree.SubElement(passport_elem, "PassportDateIssued").text = self.issue_date.isoformat()
         if self.expiration_date:
-            etree.SubElement(passport_elem, "PassportExpiration").text = self.expiration_date.strftime("%Y-%m-%d")
+            etree.SubElement(passport_elem, "PassportExpiration").text = self.expiration_date.isoformat()
         # Note: 'Primary' field not in schema - removing
-            
+        
         return passport_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append passport XML to out"""
+        out.append(
+            f"<Passport><PassportNumber>{_escape_text(self.doc_number)}</PassportNumber>"
+            f"<PassportNationality>{_escape_text(self.nationality)}</PassportNationality>"
+            f"<PassportCountryIssued>{_escape_text(self.issue_country)}</PassportCountryIssued>"
+        )
+        if self.issue_date:
+            out.append(f"<PassportDateIssued>{self.issue_date.isoformat()}</PassportDateIssued>")
+        if self.expiration_date:
+            out.append(f"<PassportExpiration>{self.expiration_date.isoformat()}</PassportExpiration>")
+        out.append("</Passport>")
 
 
-@dataclass
+@dataclass(slots=True)
 class Visa:
     """Represents a visa"""
     visa_nationality: str
@@ -583,27 +1031,44 @@ class Visa:
     visa_date_issued: Optional[date] = None
     visa_expiration: Optional[date] = None
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def validate(self) -> None:
+        """Raise ValidationError if either country is not ISO 3166-1 alpha-2"""
+        _validate_country_code(self.visa_nationality, "visa_nationality")
+        _validate_country_code(self.visa_country_issued, "visa_country_issued")
+    
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add visa as XML element to parent"""
-        visa_elem = etree.SubElement(parent, "Visa")
-        
         # Order elements per schema: VisaNationality, VisaNumber, VisaType, VisaDateIssued, VisaExpiration, VisaCityIssued, VisaCountryIssued
+        visa_elem = etree.SubElement(parent, "Visa")
         etree.SubElement(visa_elem, "VisaNationality").text = self.visa_nationality
         etree.SubElement(visa_elem, "VisaNumber").text = self.visa_number
-        etree.SubElement(visa_elem, "VisaType").text = self.visa_type.value
+        etree.SubElement(visa_elem, "VisaType").text = _ENUM_TEXT[self.visa_type]
         
         if self.visa_date_issued:
-            etree.SubElement(visa_elem, "VisaDateIssued").text = self.visa_date_issued.strftime("%Y-%m-%d")
+            etree.SubElement(visa_elem, "VisaDateIssued").text = self.visa_date_issued.isoformat()
         if self.visa_expiration:
-            etree.SubElement(visa_elem, "VisaExpiration").text = self.visa_expiration.strftime("%Y-%m-%d")
+            etree.SubElement(visa_elem, "VisaExpiration").text = self.visa_expiration.isoformat()
         
         # VisaCityIssued not implemented yet but should come before VisaCountryIssued
         etree.SubElement(visa_elem, "VisaCountryIssued").text = self.visa_country_issued
-            
+        
         return visa_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append visa XML to out, in the same schema order as to_xml_element"""
+        out.append(
+            f"<Visa><VisaNationality>{_escape_text(self.visa_nationality)}</VisaNationality>"
+            f"<VisaNumber>{_escape_text(self.visa_number)}</VisaNumber>"
+            f"<VisaType>{_ENUM_TEXT[self.visa_type]}</VisaType>"
+        )
+        if self.visa_date_issued:
+            out.append(f"<VisaDateIssued>{self.visa_date_issued.isoformat()}</VisaDateIssued>")
+        if self.visa_expiration:
+            out.append(f"<VisaExpiration>{self.visa_expiration.isoformat()}</VisaExpiration>")
+        out.append(f"<VisaCountryIssued>{_escape_text(self.visa_country_issued)}</VisaCountryIssued></Visa>")
 
 
-@dataclass
+@dataclass(slots=True)
 class TSAInfo:
     """Represents TSA information"""
     known_traveler_number: str = ""
@@ -612,34 +1077,40 @@ class TSAInfo:
     redress_number: str = ""
     no_middle_name: bool = False
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add TSA info as XML element to parent"""
         tsa_elem = etree.SubElement(parent, "TSAInfo")
         
         # Order elements according to schema: Gender, DateOfBirth, NoMiddleName, PreCheckNumber, RedressNumber
         if self.gender:
-            gender_elem = etree.SubElement(tsa_elem, "Gender")
             # Convert single letter gender codes to schema-compliant values
-            if self.gender.upper() == 'M':
-                gender_elem.text = "Male"
-            elif self.gender.upper() == 'F':
-                gender_elem.text = "Female"
-            elif self.gender in ["Male", "Female", "Undisclosed", "Unknown", "Unspecified"]:
-                gender_elem.text = self.gender
-            else:
-                gender_elem.text = "Unknown"
+            etree.SubElement(tsa_elem, "Gender").text = _tsa_gender_text(self.gender)
         if self.date_of_birth:
-            etree.SubElement(tsa_elem, "DateOfBirth").text = self.date_of_birth.strftime("%Y-%m-%d")
-        etree.SubElement(tsa_elem, "NoMiddleName").text = "true" if self.no_middle_name else "false"
+            etree.SubElement(tsa_elem, "DateOfBirth").text = self.date_of_birth.isoformat()
+        etree.SubElement(tsa_elem, "NoMiddleName").text = _BOOL_TEXT[bool(self.no_middle_name)]
         if self.known_traveler_number:
             etree.SubElement(tsa_elem, "PreCheckNumber").text = self.known_traveler_number
         if self.redress_number:
             etree.SubElement(tsa_elem, "RedressNumber").text = self.redress_number
-            
+        
         return tsa_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append TSA info XML to out, in the same schema order as to_xml_element"""
+        out.append("<TSAInfo>")
+        if self.gender:
+            out.append(f"<Gender>{_tsa_gender_text(self.gender)}</Gender>")
+        if self.date_of_birth:
+            out.append(f"<DateOfBirth>{self.date_of_birth.isoformat()}</DateOfBirth>")
+        out.append(f"<NoMiddleName>{_BOOL_TEXT[bool(self.no_middle_name)]}</NoMiddleName>")
+        if self.known_traveler_number:
+            out.append(f"<PreCheckNumber>{_escape_text(self.known_traveler_number)}</PreCheckNumber>")
+        if self.redress_number:
+            out.append(f"<RedressNumber>{_escape_text(self.redress_number)}</RedressNumber>")
+        out.append("</TSAInfo>")
 
 
-@dataclass
+@dataclass(slots=True)
 class LoyaltyProgram:
     """Represents a loyalty program membership"""
     program_type: LoyaltyProgramType
@@ -654,35 +1125,24 @@ class LoyaltyProgram:
     segments_until_next_status: str = ""
     expiration: Optional[date] = None
     
-    def to_xml_element(self, parent: etree.Element, membership_type: str = "Membership") -> etree.Element:
+    def to_xml_element(self, parent: etree._Element, membership_type: str = "Membership") -> etree._Element:
         """Add loyalty program as XML element to parent"""
-        membership_elem = etree.SubElement(parent, membership_type)
-        
         # For Profile v2 AdvantageMemberships, use the correct schema fields
         if membership_type == "Membership":
-            # Profile v2 AdvantageMemberships schema (required fields)
+            # Profile v2 AdvantageMemberships schema (required fields); ProgramNumber is the
+            # account number and ProgramCode reuses the vendor code for simplicity
+            membership_elem = etree.SubElement(parent, "Membership")
             etree.SubElement(membership_elem, "VendorCode").text = self.vendor_code
-            
-            # Map program type to VendorType string
-            vendor_type_map = {
-                LoyaltyProgramType.AIR: "Air",
-                LoyaltyProgramType.HOTEL: "Hotel", 
-                LoyaltyProgramType.CAR: "Car",
-                LoyaltyProgramType.RAIL: "Rail"
-            }
-            etree.SubElement(membership_elem, "VendorType").text = vendor_type_map[self.program_type]
-            
-            # ProgramNumber is the account number in Profile v2
+            etree.SubElement(membership_elem, "VendorType").text = _ENUM_TEXT[self.program_type]
             etree.SubElement(membership_elem, "ProgramNumber").text = self.account_number
-            
-            # ProgramCode is required - use vendor code as program code for simplicity
             etree.SubElement(membership_elem, "ProgramCode").text = self.vendor_code
             
             # Optional fields for Profile v2
             if self.expiration:
-                etree.SubElement(membership_elem, "ExpirationDate").text = self.expiration.strftime("%Y-%m-%d")
+                etree.SubElement(membership_elem, "ExpirationDate").text = self.expiration.isoformat()
         else:
             # For Loyalty v1 API, use the full schema with all fields
+            membership_elem = etree.SubElement(parent, membership_type)
             etree.SubElement(membership_elem, "VendorCode").text = self.vendor_code
             etree.SubElement(membership_elem, "AccountNo").text = self.account_number
             
@@ -701,12 +1161,62 @@ class LoyaltyProgram:
             if self.segments_until_next_status:
                 etree.SubElement(membership_elem, "SegmentsUntilNextStatus").text = self.segments_until_next_status
             if self.expiration:
-                etree.SubElement(membership_elem, "Expiration").text = self.expiration.strftime("%Y-%m-%d")
-            
+                etree.SubElement(membership_elem, "Expiration").text = self.expiration.isoformat()
+        
         return membership_elem
+    
+    def to_xml(self, out: List[str], membership_type: str = "Membership") -> None:
+        """Append loyalty program XML to out"""
+        out.append(f"<{membership_type}>")
+        
+        if membership_type == "Membership":
+            # Profile v2 AdvantageMemberships schema, see to_xml_element
+            vendor_code = _escape_text(self.vendor_code)
+            out.append(
+                f"<VendorCode>{vendor_code}</VendorCode><VendorType>{_ENUM_TEXT[self.program_type]}</VendorType>"
+                f"<ProgramNumber>{_escape_text(self.account_number)}</ProgramNumber>"
+                f"<ProgramCode>{vendor_code}</ProgramCode>"
+            )
+            if self.expiration:
+                out.append(f"<ExpirationDate>{self.expiration.isoformat()}</ExpirationDate>")
+        else:
+            # Loyalty v1 API schema
+            out.append(
+                f"<VendorCode>{_escape_text(self.vendor_code)}</VendorCode>"
+                f"<AccountNo>{_escape_text(self.account_number)}</AccountNo>"
+            )
+            if self.status:
+                out.append(f"<Status>{_escape_text(self.status)}</Status>")
+            if self.status_benefits:
+                out.append(f"<StatusBenefits>{_escape_text(self.status_benefits)}</StatusBenefits>")
+            if self.point_total:
+                out.append(f"<PointTotal>{_escape_text(self.point_total)}</PointTotal>")
+            if self.segment_total:
+                out.append(f"<SegmentTotal>{_escape_text(self.segment_total)}</SegmentTotal>")
+            if self.next_status:
+                out.append(f"<NextStatus>{_escape_text(self.next_status)}</NextStatus>")
+            if self.points_until_next_status:
+                out.append(f"<PointsUntilNextStatus>{_escape_text(self.points_until_next_status)}</PointsUntilNextStatus>")
+            if self.segments_until_next_status:
+                out.append(f"<SegmentsUntilNextStatus>{_escape_text(self.segments_until_next_status)}</SegmentsUntilNextStatus>")
+            if self.expiration:
+                out.append(f"<Expiration>{self.expiration.isoformat()}</Expiration>")
+        
+        out.append(f"</{membership_type}>")
+
 
+# RatePreferences XML for every combination of the four flags, indexed by
+# aaa_rate | aarp_rate << 1 | govt_rate << 2 | military_rate << 3
+_RATE_PREFERENCES_XML = tuple(
+    f"<RatePreferences><AAARate>{_BOOL_TEXT[key & 1]}</AAARate>"
+    f"<AARPRate>{_BOOL_TEXT[key >> 1 & 1]}</AARPRate>"
+    f"<GovtRate>{_BOOL_TEXT[key >> 2 & 1]}</GovtRate>"
+    f"<MilitaryRate>{_BOOL_TEXT[key >> 3 & 1]}</MilitaryRate></RatePreferences>"
+    for key in range(16)
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class RatePreference:
     """Represents rate preferences"""
     aaa_rate: bool = False
@@ -714,32 +1224,42 @@ class RatePreference:
     govt_rate: bool = False
     military_rate: bool = False
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add rate preferences as XML element to parent"""
         rate_elem = etree.SubElement(parent, "RatePreferences")
         
-        etree.SubElement(rate_elem, "AAARate").text = "true" if self.aaa_rate else "false"
-        etree.SubElement(rate_elem, "AARPRate").text = "true" if self.aarp_rate else "false"
-        etree.SubElement(rate_elem, "GovtRate").text = "true" if self.govt_rate else "false"
-        etree.SubElement(rate_elem, "MilitaryRate").text = "true" if self.military_rate else "false"
+        etree.SubElement(rate_elem, "AAARate").text = _BOOL_TEXT[bool(self.aaa_rate)]
+        etree.SubElement(rate_elem, "AARPRate").text = _BOOL_TEXT[bool(self.aarp_rate)]
+        etree.SubElement(rate_elem, "GovtRate").text = _BOOL_TEXT[bool(self.govt_rate)]
+        etree.SubElement(rate_elem, "MilitaryRate").text = _BOOL_TEXT[bool(self.military_rate)]
             
         return rate_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append rate preferences XML to out"""
+        out.append(_RATE_PREFERENCES_XML[
+            bool(self.aaa_rate) | bool(self.aarp_rate) << 1 | bool(self.govt_rate) << 2 | bool(self.military_rate) << 3
+        ])
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscountCode:
     """Represents a discount code"""
     vendor: str
     code: str
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add discount code as XML element to parent"""
         discount_elem = etree.SubElement(parent, "DiscountCode", Vendor=self.vendor)
         discount_elem.text = self.code
         return discount_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append discount code XML to out"""
+        out.append(f'<DiscountCode Vendor="{_escape_attr(self.vendor)}">{_escape_text(self.code)}</DiscountCode>')
 
 
-@dataclass
+@dataclass(slots=True)
 class AirPreferences:
     """Represents air travel preferences"""
     seat_preference: Optional[SeatPreference] = None
@@ -749,29 +1269,26 @@ class AirPreferences:
     air_other: str = ""
     memberships: List[LoyaltyProgram] = field(default_factory=list)
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add air preferences as XML element to parent"""
         air_elem = etree.SubElement(parent, "Air")
         
         # IMPORTANT: Based on API testing, the <Seat> element seems to be required 
         # even when only other air preferences (like home_airport) are set.
         # Always include the Seat element if we have any air preferences.
-        
-        # Check if we need to create a Seat element
         has_seat_prefs = self.seat_preference or self.seat_section
         has_other_air_prefs = self.home_airport or self.air_other or self.meal_preference
         
-        # Always create Seat element if we have any air preferences to avoid validation errors
         if has_seat_prefs or has_other_air_prefs:
             seat_elem = etree.SubElement(air_elem, "Seat")
             if self.seat_preference:
-                etree.SubElement(seat_elem, "InterRowPositionCode").text = self.seat_preference.value
+                etree.SubElement(seat_elem, "InterRowPositionCode").text = _ENUM_TEXT[self.seat_preference]
             if self.seat_section:
-                etree.SubElement(seat_elem, "SectionPositionCode").text = self.seat_section.value
+                etree.SubElement(seat_elem, "SectionPositionCode").text = _ENUM_TEXT[self.seat_section]
         
         # Meal preferences
         if self.meal_preference:
-            etree.SubElement(air_elem, "MealCode").text = self.meal_preference.value
+            etree.SubElement(air_elem, "MealCode").text = _ENUM_TEXT[self.meal_preference]
         
         # Other preferences
         if self.home_airport:
@@ -781,16 +1298,33 @@ class AirPreferences:
         
         # NOTE: Memberships are excluded from travel preference updates
         # They should be managed via the dedicated Loyalty API
-        # if self.memberships:
-        #     memberships_elem = etree.SubElement(air_elem, "AirMemberships")
-        #     for membership in self.memberships:
-        #         if membership.program_type == LoyaltyProgramType.AIR:
-        #             membership.to_xml_element(memberships_elem, "AirMembership")
-            
+        
         return air_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append air preferences XML to out (memberships excluded, see to_xml_element)"""
+        out.append("<Air>")
+        
+        # Seat is required whenever any air preference is set
+        if self.seat_preference or self.seat_section or self.home_airport or self.air_other or self.meal_preference:
+            out.append("<Seat>")
+            if self.seat_preference:
+                out.append(f"<InterRowPositionCode>{_ENUM_TEXT[self.seat_preference]}</InterRowPositionCode>")
+            if self.seat_section:
+                out.append(f"<SectionPositionCode>{_ENUM_TEXT[self.seat_section]}</SectionPositionCode>")
+            out.append("</Seat>")
+        
+        if self.meal_preference:
+            out.append(f"<MealCode>{_ENUM_TEXT[self.meal_preference]}</MealCode>")
+        if self.home_airport:
+            out.append(f"<HomeAirport>{_escape_text(self.home_airport)}</HomeAirport>")
+        if self.air_other:
+            out.append(f"<AirOther>{_escape_text(self.air_other)}</AirOther>")
+        
+        out.append("</Air>")
 
 
-@dataclass
+@dataclass(slots=True)
 class HotelPreferences:
     """Represents hotel travel preferences"""
     smoking_preference: Optional[SmokingPreference] = None
@@ -806,12 +1340,27 @@ class HotelPreferences:
     prefer_early_checkin: bool = False
     memberships: List[LoyaltyProgram] = field(default_factory=list)
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
-        """Add hotel preferences as XML element to parent"""
-        # Check if we have any actual preferences to set
-        has_preferences = (
-            self.smoking_preference or 
-            self.room_type or 
+    # Emit the empty <HotelMemberships/> placeholder ahead of RoomType. Set to False on the
+    # class only after confirming the target Concur instance accepts updates without it.
+    _INCLUDE_EMPTY_HOTEL_MEMBERSHIPS = True
+    
+    # (attribute, tag) for the boolean preferences in documented order, written only when
+    # true. prefer_restaurant is left out: PreferRestaraunt is documented but not supported.
+    _FLAG_FIELDS = (
+        ("prefer_foam_pillows", "PreferFoamPillows"),
+        ("prefer_crib", "PreferCrib"),
+        ("prefer_rollaway_bed", "PreferRollawayBed"),
+        ("prefer_gym", "PreferGym"),
+        ("prefer_pool", "PreferPool"),
+        ("prefer_room_service", "PreferRoomService"),
+        ("prefer_early_checkin", "PreferEarlyCheckIn"),
+    )
+    
+    def _has_preferences(self) -> bool:
+        """Whether any preference is set; both writers skip the element otherwise"""
+        return bool(
+            self.smoking_preference or
+            self.room_type or
             self.hotel_other or
             self.prefer_foam_pillows or
             self.prefer_crib or
@@ -822,59 +1371,51 @@ class HotelPreferences:
             self.prefer_room_service or
             self.prefer_early_checkin
         )
-        
+    
+    def to_xml_element(self, parent: etree._Element) -> Optional[etree._Element]:
+        """Add hotel preferences as XML element to parent"""
         # Don't create empty hotel elements - this might cause validation issues
-        if not has_preferences:
+        if not self._has_preferences():
             return None
-            
-        hotel_elem = etree.SubElement(parent, "Hotel")
         
         # IMPORTANT: Based on API testing, some documented fields are NOT actually supported!
         # Working order: HotelMemberships, RoomType, HotelOther, PreferFoamPillows, PreferCrib, 
         # PreferRollawayBed, PreferGym, PreferPool, PreferRoomService, PreferEarlyCheckIn
         # BROKEN FIELDS (don't use): SmokingCode, PreferRestaraunt
         
-        # NOTE: SmokingCode is documented but NOT supported by the API - causes XML validation error
-        # if self.smoking_preference:
-        #     etree.SubElement(hotel_elem, "SmokingCode").text = self.smoking_preference.value
+        hotel_elem = etree.SubElement(parent, "Hotel")
         
         # HotelMemberships - include empty element to maintain schema order
         # Per documentation: only appears for travel suppliers or TMCs, but required for schema validation
-        etree.SubElement(hotel_elem, "HotelMemberships")
+        if self._INCLUDE_EMPTY_HOTEL_MEMBERSHIPS:
+            etree.SubElement(hotel_elem, "HotelMemberships")
         
         if self.room_type:
-            etree.SubElement(hotel_elem, "RoomType").text = self.room_type.value
-        
+            etree.SubElement(hotel_elem, "RoomType").text = _ENUM_TEXT[self.room_type]
         if self.hotel_other:
             etree.SubElement(hotel_elem, "HotelOther").text = self.hotel_other
         
         # Boolean preferences in documented order - only include if explicitly set to true
-        if self.prefer_foam_pillows:
-            etree.SubElement(hotel_elem, "PreferFoamPillows").text = "true"
-        
-        if self.prefer_crib:
-            etree.SubElement(hotel_elem, "PreferCrib").text = "true"
-        
-        if self.prefer_rollaway_bed:
-            etree.SubElement(hotel_elem, "PreferRollawayBed").text = "true"
-        
-        if self.prefer_gym:
-            etree.SubElement(hotel_elem, "PreferGym").text = "true"
-        
-        if self.prefer_pool:
-            etree.SubElement(hotel_elem, "PreferPool").text = "true"
-        
-        # NOTE: PreferRestaraunt is documented but not actually supported by the API
-        if self.prefer_room_service:
-            etree.SubElement(hotel_elem, "PreferRoomService").text = "true"
-        
-        if self.prefer_early_checkin:
-            etree.SubElement(hotel_elem, "PreferEarlyCheckIn").text = "true"
+        _add_flag_children(hotel_elem, self, self._FLAG_FIELDS)
         
         return hotel_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append hotel preferences XML to out, skipping the element when nothing is set"""
+        if not self._has_preferences():
+            return
+        
+        # Same working field order as to_xml_element; SmokingCode and PreferRestaraunt are unsupported
+        out.append("<Hotel><HotelMemberships/>" if self._INCLUDE_EMPTY_HOTEL_MEMBERSHIPS else "<Hotel>")
+        if self.room_type:
+            out.append(f"<RoomType>{_ENUM_TEXT[self.room_type]}</RoomType>")
+        if self.hotel_other:
+            out.append(f"<HotelOther>{_escape_text(self.hotel_other)}</HotelOther>")
+        _write_flag_children(out, self, self._FLAG_FIELDS)
+        out.append("</Hotel>")
 
 
-@dataclass
+@dataclass(slots=True)
 class CarPreferences:
     """Represents car rental preferences"""
     car_type: Optional[CarType] = None
@@ -884,19 +1425,17 @@ class CarPreferences:
     ski_rack: bool = False
     memberships: List[LoyaltyProgram] = field(default_factory=list)
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    # (attribute, tag) for the boolean preferences, written only when true
+    _FLAG_FIELDS = (("gps", "CarGPS"), ("ski_rack", "CarSkiRack"))
+    
+    def _has_preferences(self) -> bool:
+        """Whether any preference is set; both writers skip the element otherwise"""
+        return bool(self.car_type or self.transmission or self.smoking_preference or self.gps or self.ski_rack)
+    
+    def to_xml_element(self, parent: etree._Element) -> Optional[etree._Element]:
         """Add car preferences as XML element to parent"""
-        # Check if we have any actual preferences to set
-        has_preferences = (
-            self.car_type or
-            self.transmission or
-            self.smoking_preference or 
-            self.gps or 
-            self.ski_rack
-        )
-        
         # Don't create empty car elements - this might cause validation issues
-        if not has_preferences:
+        if not self._has_preferences():
             return None
             
         car_elem = etree.SubElement(parent, "Car")
@@ -907,18 +1446,15 @@ class CarPreferences:
         
         # Set car type and transmission (they default to "DontCare" if not specified)
         if self.car_type:
-            etree.SubElement(car_elem, "CarType").text = self.car_type.value
+            etree.SubElement(car_elem, "CarType").text = _ENUM_TEXT[self.car_type]
         if self.transmission:
-            etree.SubElement(car_elem, "CarTransmission").text = self.transmission.value
+            etree.SubElement(car_elem, "CarTransmission").text = _ENUM_TEXT[self.transmission]
         
         if self.smoking_preference:
-            etree.SubElement(car_elem, "CarSmokingCode").text = self.smoking_preference.value
+            etree.SubElement(car_elem, "CarSmokingCode").text = _ENUM_TEXT[self.smoking_preference]
         
         # Only include boolean fields if they're explicitly set to true
-        if self.gps:
-            etree.SubElement(car_elem, "CarGPS").text = "true"
-        if self.ski_rack:
-            etree.SubElement(car_elem, "CarSkiRack").text = "true"
+        _add_flag_children(car_elem, self, self._FLAG_FIELDS)
         
         # NOTE: Memberships are excluded from travel preference updates
         # They should be managed via the dedicated Loyalty API
@@ -929,9 +1465,24 @@ class CarPreferences:
         #             membership.to_xml_element(memberships_elem, "CarMembership")
             
         return car_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append car preferences XML to out, skipping the element when nothing is set"""
+        if not self._has_preferences():
+            return
+        
+        out.append("<Car>")
+        if self.car_type:
+            out.append(f"<CarType>{_ENUM_TEXT[self.car_type]}</CarType>")
+        if self.transmission:
+            out.append(f"<CarTransmission>{_ENUM_TEXT[self.transmission]}</CarTransmission>")
+        if self.smoking_preference:
+            out.append(f"<CarSmokingCode>{_ENUM_TEXT[self.smoking_preference]}</CarSmokingCode>")
+        _write_flag_children(out, self, self._FLAG_FIELDS)
+        out.append("</Car>")
 
 
-@dataclass
+@dataclass(slots=True)
 class RailPreferences:
     """Represents rail travel preferences"""
     seat: str = ""
@@ -947,32 +1498,25 @@ class RailPreferences:
     contingencies: str = ""
     memberships: List[LoyaltyProgram] = field(default_factory=list)
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    # (attribute, tag) for each optional text child, in schema order
+    _TEXT_FIELDS = (
+        ("seat", "Seat"),
+        ("coach", "Coach"),
+        ("noise_comfort", "NoiseComfort"),
+        ("bed", "Bed"),
+        ("bed_category", "BedCategory"),
+        ("berth", "Berth"),
+        ("deck", "Deck"),
+        ("space_type", "SpaceType"),
+        ("fare_space_comfort", "FareSpaceComfort"),
+        ("special_meals", "SpecialMeals"),
+        ("contingencies", "Contingencies"),
+    )
+    
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add rail preferences as XML element to parent"""
         rail_elem = etree.SubElement(parent, "Rail")
-        
-        if self.seat:
-            etree.SubElement(rail_elem, "Seat").text = self.seat
-        if self.coach:
-            etree.SubElement(rail_elem, "Coach").text = self.coach
-        if self.noise_comfort:
-            etree.SubElement(rail_elem, "NoiseComfort").text = self.noise_comfort
-        if self.bed:
-            etree.SubElement(rail_elem, "Bed").text = self.bed
-        if self.bed_category:
-            etree.SubElement(rail_elem, "BedCategory").text = self.bed_category
-        if self.berth:
-            etree.SubElement(rail_elem, "Berth").text = self.berth
-        if self.deck:
-            etree.SubElement(rail_elem, "Deck").text = self.deck
-        if self.space_type:
-            etree.SubElement(rail_elem, "SpaceType").text = self.space_type
-        if self.fare_space_comfort:
-            etree.SubElement(rail_elem, "FareSpaceComfort").text = self.fare_space_comfort
-        if self.special_meals:
-            etree.SubElement(rail_elem, "SpecialMeals").text = self.special_meals
-        if self.contingencies:
-            etree.SubElement(rail_elem, "Contingencies").text = self.contingencies
+        _add_text_children(rail_elem, self, self._TEXT_FIELDS)
         
         # NOTE: Memberships are excluded from travel preference updates
         # They should be managed via the dedicated Loyalty API
@@ -983,23 +1527,33 @@ class RailPreferences:
         #             membership.to_xml_element(memberships_elem, "RailMembership")
             
         return rail_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append rail preferences XML to out (memberships excluded, see to_xml_element)"""
+        out.append("<Rail>")
+        _write_text_children(out, self, self._TEXT_FIELDS)
+        out.append("</Rail>")
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomField:
     """Represents a custom field"""
     field_id: str
     value: str
     field_type: str = "Text"
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add custom field as XML element to parent"""
         field_elem = etree.SubElement(parent, "CustomField", Name=self.field_id)
         field_elem.text = self.value
         return field_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append custom field XML to out"""
+        out.append(f'<CustomField Name="{_escape_attr(self.field_id)}">{_escape_text(self.value)}</CustomField>')
 
 
-@dataclass
+@dataclass(slots=True)
 class UnusedTicket:
     """Represents an unused ticket"""
     ticket_number: str
@@ -1007,7 +1561,7 @@ class UnusedTicket:
     amount: str = ""
     currency: str = "USD"
     
-    def to_xml_element(self, parent: etree.Element) -> etree.Element:
+    def to_xml_element(self, parent: etree._Element) -> etree._Element:
         """Add unused ticket as XML element to parent"""
         ticket_elem = etree.SubElement(parent, "UnusedTicket")
         
@@ -1019,9 +1573,60 @@ class UnusedTicket:
             etree.SubElement(ticket_elem, "Currency").text = self.currency
             
         return ticket_elem
+    
+    def to_xml(self, out: List[str]) -> None:
+        """Append unused ticket XML to out"""
+        out.append(
+            f"<UnusedTicket><TicketNumber>{_escape_text(self.ticket_number)}</TicketNumber>"
+            f"<AirlineCode>{_escape_text(self.airline_code)}</AirlineCode>"
+        )
+        if self.amount:
+            out.append(f"<Amount>{_escape_text(self.amount)}</Amount>")
+        if self.currency:
+            out.append(f"<Currency>{_escape_text(self.currency)}</Currency>")
+        out.append("</UnusedTicket>")
 
 
-@dataclass
+def _element_section(root: etree._Element, tag: Optional[str], value: Any) -> None:
+    """Let a single section object add its own element to root"""
+    value.to_xml_element(root)
+
+
+def _element_list_section(root: etree._Element, tag: Optional[str], items: List[Any]) -> None:
+    """Add a container element holding one child per item (all of one class)"""
+    container = etree.SubElement(root, tag)
+    # Resolve the writer once for the whole list instead of binding it per item
+    to_xml_element = type(items[0]).to_xml_element
+    for item in items:
+        to_xml_element(item, container)
+
+
+def _element_flag_section(root: etree._Element, tag: Optional[str], value: bool) -> None:
+    """Add a boolean element that is only sent when true"""
+    etree.SubElement(root, tag).text = "true"
+
+
+def _string_section(out: List[str], tag: Optional[str], value: Any) -> None:
+    """Let a single section object append its own XML to out"""
+    value.to_xml(out)
+
+
+def _string_list_section(out: List[str], tag: Optional[str], items: List[Any]) -> None:
+    """Append a container element holding one child per item (all of one class)"""
+    out.append(f"<{tag}>")
+    # Resolve the writer once for the whole list instead of binding it per item
+    to_xml = type(items[0]).to_xml
+    for item in items:
+        to_xml(item, out)
+    out.append(f"</{tag}>")
+
+
+def _string_flag_section(out: List[str], tag: Optional[str], value: bool) -> None:
+    """Append a boolean element that is only sent when true"""
+    out.append(f"<{tag}>true</{tag}>")
+
+
+@dataclass(slots=True)
 class TravelProfile:
     """Travel Profile v2 data - contains only travel-specific information"""
     login_id: str
@@ -1058,182 +1663,476 @@ class TravelProfile:
     # Loyalty programs (consolidated)
     loyalty_programs: List[LoyaltyProgram] = field(default_factory=list)
     
-    def to_update_xml(self, fields_to_update: Optional[List[str]] = None) -> str:
-        """Convert to XML for travel profile update using lxml"""
-        # Create root element with proper namespace and schema location
-        root = etree.Element("ProfileResponse", 
-                           nsmap={'xsi': 'http://www.w3.org/2001/XMLSchema-instance'})
-        root.set("Action", ProfileAction.UPDATE.value)
-        root.set("LoginId", self.login_id)
+    # Update sections in schema order after General:
+    # (field name, container tag, lxml writer, string writer)
+    _SECTION_SCHEMA = (
+        ("national_ids", "NationalIDs", _element_list_section, _string_list_section),
+        ("drivers_licenses", "DriversLicenses", _element_list_section, _string_list_section),
+        ("has_no_passport", "HasNoPassport", _element_flag_section, _string_flag_section),
+        ("passports", "Passports", _element_list_section, _string_list_section),
+        ("visas", "Visas", _element_list_section, _string_list_section),
+        ("rate_preferences", None, _element_section, _string_section),
+        ("discount_codes", "DiscountCodes", _element_list_section, _string_list_section),
+        ("air_preferences", None, _element_section, _string_section),
+        ("rail_preferences", None, _element_section, _string_section),
+        ("car_preferences", None, _element_section, _string_section),
+        ("hotel_preferences", None, _element_section, _string_section),
+        ("custom_fields", "CustomFields", _element_list_section, _string_list_section),
+        ("tsa_info", None, _element_section, _string_section),
+        ("unused_tickets", "UnusedTickets", _element_list_section, _string_list_section),
+        ("southwest_unused_tickets", "SouthwestUnusedTickets", _element_list_section, _string_list_section),
+        ("loyalty_programs", "AdvantageMemberships", _element_list_section, _string_list_section),
+    )
+    
+    # All section values in schema order, read in one call
+    _SECTION_VALUES = operator.attrgetter(*(name for name, _, _, _ in _SECTION_SCHEMA))
+    
+    # Fields sent by default when they are non-empty (has_no_passport only when asked for),
+    # read in one call through attrgetter
+    _DEFAULT_UPDATE_FIELDS = ("rule_class", "travel_config_id") + tuple(
+        name for name, _, _, _ in _SECTION_SCHEMA if name != "has_no_passport"
+    )
+    _DEFAULT_UPDATE_VALUES = operator.attrgetter(*_DEFAULT_UPDATE_FIELDS)
+    
+    def validate(self, fields_to_update: Optional[List[str]] = None) -> None:
+        """Check the documents an update would send, raising ValidationError
         
+        Only the sections in fields_to_update (all of them when None) are
+        checked, so values read back from Concur never block unrelated updates.
+        """
+        for name in ("passports", "visas"):
+            if fields_to_update is None or name in fields_to_update:
+                for document in getattr(self, name):
+                    document.validate()
+    
+    def to_update_xml(
+        self,
+        fields_to_update: Optional[List[str]] = None,
+        legacy: bool = False,
+        *,
+        pretty: bool = False
+    ) -> str:
+        """Convert to XML for travel profile update
+        
+        The document is written straight to a string by the per-class to_xml
+        writers; pass legacy=True to build it through the lxml tree instead
+        (pretty=True indents that tree for logging).
+        """
+        if legacy:
+            return self._update_tree_bytes(fields_to_update, pretty).decode('utf-8')
+        return "".join(self._update_parts(fields_to_update))
+    
+    def to_update_bytes(
+        self,
+        fields_to_update: Optional[List[str]] = None,
+        legacy: bool = False,
+        *,
+        pretty: bool = False
+    ) -> bytes:
+        """Same document as to_update_xml, encoded as the UTF-8 request body"""
+        if legacy:
+            return self._update_tree_bytes(fields_to_update, pretty)
+        return "".join(self._update_parts(fields_to_update)).encode('utf-8')
+    
+    def _update_parts(self, fields_to_update: Optional[List[str]]) -> List[str]:
+        """Write the update document as a list of str fragments"""
         # If no specific fields, update all non-empty fields
         if fields_to_update is None:
             fields_to_update = self._get_non_empty_fields()
         
+        out = [f'{_UPDATE_ROOT_PREFIX}{_escape_attr(self.login_id)}">']
+        self._write_sections(out, fields_to_update)
+        out.append("</ProfileResponse>")
+        return out
+    
+    def _update_tree_bytes(self, fields_to_update: Optional[List[str]], pretty: bool) -> bytes:
+        """Build the update document as an lxml tree and serialize it"""
+        if fields_to_update is None:
+            fields_to_update = self._get_non_empty_fields()
+        
+        # Create root element with proper namespace and schema location
+        root = etree.Element("ProfileResponse", nsmap=_PROFILE_NSMAP)
+        root.set("Action", _UPDATE_ACTION)
+        root.set("LoginId", self.login_id)
+        
         # Add sections based on fields_to_update
         self._add_sections_to_xml(root, fields_to_update)
         
-        # Return properly formatted XML
         return etree.tostring(root, 
-                             pretty_print=True, 
+                             pretty_print=pretty, 
                              xml_declaration=True, 
-                             encoding='utf-8').decode('utf-8')
+                             encoding='utf-8')
     
     def _get_non_empty_fields(self) -> List[str]:
         """Get list of non-empty field names for update"""
-        fields = []
-        if self.rule_class: fields.append("rule_class")
-        if self.travel_config_id: fields.append("travel_config_id")
-        if self.national_ids: fields.append("national_ids")
-        if self.drivers_licenses: fields.append("drivers_licenses")
-        if self.passports: fields.append("passports")
-        if self.visas: fields.append("visas")
-        if self.tsa_info: fields.append("tsa_info")
-        if self.rate_preferences: fields.append("rate_preferences")
-        if self.discount_codes: fields.append("discount_codes")
-        if self.air_preferences: fields.append("air_preferences")
-        if self.hotel_preferences: fields.append("hotel_preferences")
-        if self.car_preferences: fields.append("car_preferences")
-        if self.rail_preferences: fields.append("rail_preferences")
-        if self.custom_fields: fields.append("custom_fields")
-        if self.unused_tickets: fields.append("unused_tickets")
-        if self.southwest_unused_tickets: fields.append("southwest_unused_tickets")
-        if self.loyalty_programs: fields.append("loyalty_programs")
-        return fields
-    
-    def _add_sections_to_xml(self, root: etree.Element, fields_to_update: Optional[List[str]] = None):
+        # compress keeps the names whose value is truthy without a Python-level loop
+        return list(itertools.compress(self._DEFAULT_UPDATE_FIELDS, self._DEFAULT_UPDATE_VALUES(self)))
+    
+    def _add_sections_to_xml(self, root: etree._Element, fields_to_update: Optional[List[str]] = None):
         """Add travel profile sections to XML in schema order"""
+        # An empty list means every non-empty section, but no General section
+        mask = frozenset(fields_to_update) if fields_to_update else None
         
         # General section for travel config
-        general_fields = ["rule_class", "travel_config_id"]
-        if any(f in fields_to_update for f in general_fields):
-            general = etree.SubElement(root, "General")
-            
-            if "rule_class" in fields_to_update and self.rule_class:
-                etree.SubElement(general, "RuleClass").text = self.rule_class
-            if "travel_config_id" in fields_to_update and self.travel_config_id:
-                etree.SubElement(general, "TravelConfigID").text = self.travel_config_id
-        
-        # Travel documents in schema order
-        if not fields_to_update or "national_ids" in fields_to_update:
-            if self.national_ids:
-                ids_elem = etree.SubElement(root, "NationalIDs")
-                for national_id in self.national_ids:
-                    national_id.to_xml_element(ids_elem)
-        
-        if not fields_to_update or "drivers_licenses" in fields_to_update:
-            if self.drivers_licenses:
-                licenses_elem = etree.SubElement(root, "DriversLicenses")
-                for license in self.drivers_licenses:
-                    license.to_xml_element(licenses_elem)
-        
-        if not fields_to_update or "has_no_passport" in fields_to_update:
-            if self.has_no_passport:
-                etree.SubElement(root, "HasNoPassport").text = "true"
-        
-        if not fields_to_update or "passports" in fields_to_update:
-            if self.passports:
-                passports_elem = etree.SubElement(root, "Passports")
-                for passport in self.passports:
-                    passport.to_xml_element(passports_elem)
-        
-        if not fields_to_update or "visas" in fields_to_update:
-            if self.visas:
-                visas_elem = etree.SubElement(root, "Visas")
-                for visa in self.visas:
-                    visa.to_xml_element(visas_elem)
-        
-        # Rate preferences and discount codes
-        if not fields_to_update or "rate_preferences" in fields_to_update:
-            if self.rate_preferences:
-                self.rate_preferences.to_xml_element(root)
-        
-        if not fields_to_update or "discount_codes" in fields_to_update:
-            if self.discount_codes:
-                codes_elem = etree.SubElement(root, "DiscountCodes")
-                for code in self.discount_codes:
-                    code.to_xml_element(codes_elem)
-        
-        # Travel preferences
-        if not fields_to_update or "air_preferences" in fields_to_update:
-            if self.air_preferences:
-                self.air_preferences.to_xml_element(root)
-        
-        if not fields_to_update or "rail_preferences" in fields_to_update:
-            if self.rail_preferences:
-                self.rail_preferences.to_xml_element(root)
-        
-        if not fields_to_update or "car_preferences" in fields_to_update:
-            if self.car_preferences:
-                car_elem = self.car_preferences.to_xml_element(root)
-        
-        if not fields_to_update or "hotel_preferences" in fields_to_update:
-            if self.hotel_preferences:
-                hotel_elem = self.hotel_preferences.to_xml_element(root)
-        
-        # Custom fields
-        if not fields_to_update or "custom_fields" in fields_to_update:
-            if self.custom_fields:
-                fields_elem = etree.SubElement(root, "CustomFields")
-                for field in self.custom_fields:
-                    field.to_xml_element(fields_elem)
-        
-        # TSA info
-        if not fields_to_update or "tsa_info" in fields_to_update:
-            if self.tsa_info:
-                self.tsa_info.to_xml_element(root)
-        
-        # Unused tickets
-        if not fields_to_update or "unused_tickets" in fields_to_update:
-            if self.unused_tickets:
-                tickets_elem = etree.SubElement(root, "UnusedTickets")
-                for ticket in self.unused_tickets:
-                    ticket.to_xml_element(tickets_elem)
-        
-        if not fields_to_update or "southwest_unused_tickets" in fields_to_update:
-            if self.southwest_unused_tickets:
-                sw_tickets_elem = etree.SubElement(root, "SouthwestUnusedTickets")
-                for ticket in self.southwest_unused_tickets:
-                    ticket.to_xml_element(sw_tickets_elem)
-        
-        # Loyalty programs
-        if not fields_to_update or "loyalty_programs" in fields_to_update:
-            if self.loyalty_programs:
-                memberships_elem = etree.SubElement(root, "AdvantageMemberships")
-                for loyalty_program in self.loyalty_programs:
-                    loyalty_program.to_xml_element(memberships_elem, "Membership")
-
-
-@dataclass
-class IdentityPatchOperation:
-    """SCIM 2.0 PATCH operation for Identity v4"""
-    op: str  # "add", "remove", "replace"
-    path: str
-    value: Any = None
+        if mask is not None and ("rule_class" in mask or "travel_config_id" in mask):
+            sub_element = etree.SubElement
+            general = sub_element(root, "General")
+            
+            if "rule_class" in mask and self.rule_class:
+                sub_element(general, "RuleClass").text = self.rule_class
+            if "travel_config_id" in mask and self.travel_config_id:
+                sub_element(general, "TravelConfigID").text = self.travel_config_id
+        
+        # Most sections are empty, so test the value before the field mask
+        for (name, tag, element_writer, _), value in zip(self._SECTION_SCHEMA, self._SECTION_VALUES(self)):
+            if value and (mask is None or name in mask):
+                element_writer(root, tag, value)
     
-    def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "op": self.op,
-            "path": self.path
-        }
-        if self.value is not None:
-            result["value"] = self.value
-        return result
+    def _write_sections(self, out: List[str], fields_to_update: Optional[List[str]] = None) -> None:
+        """Append travel profile sections to out, same order and rules as _add_sections_to_xml"""
+        mask = frozenset(fields_to_update) if fields_to_update else None
+        
+        # General section for travel config
+        if mask is not None and ("rule_class" in mask or "travel_config_id" in mask):
+            out.append("<General>")
+            if "rule_class" in mask and self.rule_class:
+                out.append(f"<RuleClass>{_escape_text(self.rule_class)}</RuleClass>")
+            if "travel_config_id" in mask and self.travel_config_id:
+                out.append(f"<TravelConfigID>{_escape_text(self.travel_config_id)}</TravelConfigID>")
+            out.append("</General>")
+        
+        # Most sections are empty, so test the value before the field mask
+        for (name, tag, _, string_writer), value in zip(self._SECTION_SCHEMA, self._SECTION_VALUES(self)):
+            if value and (mask is None or name in mask):
+                string_writer(out, tag, value)
+
+
+def _serialize_update(profile: TravelProfile, fields_to_update: Optional[List[str]] = None) -> bytes:
+    """Update body for one profile; module-level so process pool workers can run it"""
+    return profile.to_update_bytes(fields_to_update)
+
+
+def _parse_iso_date(value: Optional[str]) -> Optional[date]:
+    """Parse YYYY-MM-DD response text, returning None when empty or invalid"""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    # Unpadded months and days (as strptime's %m/%d take) are the only other dates
+    # accepted; anything else fails the regex rather than raising
+    match = _ISO_DATE_RE.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day = map(int, match.groups())
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return date(year, month, day)
+
+
+def _child_texts(elem: etree._Element) -> Dict[str, str]:
+    """Text of each direct child by tag in one scan; the first child wins, as with findtext"""
+    return {child.tag: child.text or "" for child in reversed(elem)}
+
+
+def _read_general(profile: TravelProfile, general_elem: etree._Element) -> None:
+    profile.rule_class = general_elem.findtext("RuleClass", "")
+    profile.travel_config_id = general_elem.findtext("TravelConfigID", "")
+
+
+def _read_has_no_passport(profile: TravelProfile, flag_elem: etree._Element) -> None:
+    profile.has_no_passport = (flag_elem.text or "").lower() == "true"
+
+
+def _read_national_ids(profile: TravelProfile, national_ids_elem: etree._Element) -> None:
+    profile.national_ids = [
+        NationalID(
+            id_number=values.get("NationalIDNumber", ""),
+            country_code=values.get("IssuingCountry", "")
+        )
+        for values in map(_child_texts, national_ids_elem.iterchildren("NationalID"))
+    ]
 
 
-@dataclass
+def _read_drivers_licenses(profile: TravelProfile, licenses_elem: etree._Element) -> None:
+    profile.drivers_licenses = [
+        DriversLicense(
+            license_number=values.get("DriversLicenseNumber", ""),
+            country_code=values.get("IssuingCountry", ""),
+            state_province=values.get("IssuingState", "")
+        )
+        for values in map(_child_texts, licenses_elem.iterchildren("DriversLicense"))
+    ]
+
+
+def _read_passports(profile: TravelProfile, passports_elem: etree._Element) -> None:
+    profile.passports = [
+        Passport(
+            doc_number=values.get("PassportNumber", ""),
+            nationality=values.get("PassportNationality", ""),
+            issue_country=values.get("PassportCountryIssued", ""),
+            issue_date=_parse_iso_date(values.get("PassportDateIssued")),
+            expiration_date=_parse_iso_date(values.get("PassportExpiration"))
+        )
+        for values in map(_child_texts, passports_elem.iterchildren("Passport"))
+    ]
+
+
+def _read_visas(profile: TravelProfile, visas_elem: etree._Element) -> None:
+    profile.visas = [
+        Visa(
+            visa_nationality=values.get("VisaNationality", ""),
+            visa_number=values.get("VisaNumber", ""),
+            visa_type=_VISA_TYPES.get(values.get("VisaType", "Unknown"), VisaType.UNKNOWN),
+            visa_country_issued=values.get("VisaCountryIssued", ""),
+            visa_date_issued=_parse_iso_date(values.get("VisaDateIssued")),
+            visa_expiration=_parse_iso_date(values.get("VisaExpiration"))
+        )
+        for values in map(_child_texts, visas_elem.iterchildren("Visa"))
+    ]
+
+
+def _read_tsa_info(profile: TravelProfile, tsa_elem: etree._Element) -> None:
+    values = _child_texts(tsa_elem)
+    no_middle_name = values.get("NoMiddleName", "").lower() == "true"
+    
+    profile.tsa_info = TSAInfo(
+        known_traveler_number=values.get("PreCheckNumber", ""),
+        gender=values.get("Gender", ""),
+        date_of_birth=_parse_iso_date(values.get("DateOfBirth")),
+        redress_number=values.get("RedressNumber", ""),
+        no_middle_name=no_middle_name
+    )
+
+
+def _read_rate_preferences(profile: TravelProfile, rate_prefs_elem: etree._Element) -> None:
+    values = _child_texts(rate_prefs_elem)
+    profile.rate_preferences = RatePreference(
+        aaa_rate=values.get("AAARate", "").lower() == "true",
+        aarp_rate=values.get("AARPRate", "").lower() == "true",
+        govt_rate=values.get("GovtRate", "").lower() == "true",
+        military_rate=values.get("MilitaryRate", "").lower() == "true"
+    )
+
+
+def _read_discount_codes(profile: TravelProfile, discount_codes_elem: etree._Element) -> None:
+    # Codes missing a vendor or a value are skipped
+    profile.discount_codes = [
+        DiscountCode(vendor=code_elem.get("Vendor"), code=code_elem.text)
+        for code_elem in discount_codes_elem.iterchildren("DiscountCode")
+        if code_elem.get("Vendor") and code_elem.text
+    ]
+
+
+def _read_air(profile: TravelProfile, air_elem: etree._Element) -> None:
+    air_prefs = AirPreferences()
+    
+    # Parse seat preferences
+    seat_elem = air_elem.find("Seat")
+    if seat_elem is not None:
+        seat_preference = _SEAT_PREFERENCES.get(seat_elem.findtext("InterRowPositionCode", ""))
+        if seat_preference is not None:
+            air_prefs.seat_preference = seat_preference
+        
+        seat_section = _SEAT_SECTIONS.get(seat_elem.findtext("SectionPositionCode", ""))
+        if seat_section is not None:
+            air_prefs.seat_section = seat_section
+    
+    # Parse meal preference
+    meal_preference = _MEAL_TYPES.get(air_elem.findtext("MealCode", ""))
+    if meal_preference is not None:
+        air_prefs.meal_preference = meal_preference
+    
+    air_prefs.home_airport = air_elem.findtext("HomeAirport", "")
+    air_prefs.air_other = air_elem.findtext("AirOther", "")
+    
+    profile.air_preferences = air_prefs
+
+
+def _read_hotel(profile: TravelProfile, hotel_elem: etree._Element) -> None:
+    hotel_prefs = HotelPreferences()
+    values = _child_texts(hotel_elem)
+    
+    room_type = _HOTEL_ROOM_TYPES.get(values.get("RoomType", ""))
+    if room_type is not None:
+        hotel_prefs.room_type = room_type
+    
+    hotel_prefs.hotel_other = values.get("HotelOther", "")
+    hotel_prefs.prefer_foam_pillows = values.get("PreferFoamPillows", "") == "true"
+    hotel_prefs.prefer_crib = values.get("PreferCrib", "") == "true"
+    hotel_prefs.prefer_rollaway_bed = values.get("PreferRollawayBed", "") == "true"
+    hotel_prefs.prefer_gym = values.get("PreferGym", "") == "true"
+    hotel_prefs.prefer_pool = values.get("PreferPool", "") == "true"
+    hotel_prefs.prefer_room_service = values.get("PreferRoomService", "") == "true"
+    hotel_prefs.prefer_early_checkin = values.get("PreferEarlyCheckIn", "") == "true"
+    
+    profile.hotel_preferences = hotel_prefs
+
+
+def _read_car(profile: TravelProfile, car_elem: etree._Element) -> None:
+    car_prefs = CarPreferences()
+    values = _child_texts(car_elem)
+    
+    car_type = _CAR_TYPES.get(values.get("CarType", ""))
+    if car_type is not None:
+        car_prefs.car_type = car_type
+    
+    transmission = _TRANSMISSION_TYPES.get(values.get("CarTransmission", ""))
+    if transmission is not None:
+        car_prefs.transmission = transmission
+    
+    smoking_preference = _SMOKING_PREFERENCES.get(values.get("CarSmokingCode", ""))
+    if smoking_preference is not None:
+        car_prefs.smoking_preference = smoking_preference
+    
+    car_prefs.gps = values.get("CarGPS", "") == "true"
+    car_prefs.ski_rack = values.get("CarSkiRack", "") == "true"
+    
+    profile.car_preferences = car_prefs
+
+
+def _read_rail(profile: TravelProfile, rail_elem: etree._Element) -> None:
+    values = _child_texts(rail_elem)
+    # Same (attribute, tag) table the writers use
+    profile.rail_preferences = RailPreferences(
+        **{attr: values.get(tag, "") for attr, tag in RailPreferences._TEXT_FIELDS}
+    )
+
+
+def _read_custom_fields(profile: TravelProfile, custom_fields_elem: etree._Element) -> None:
+    # Fields without a name are skipped
+    profile.custom_fields = [
+        CustomField(field_id=field_elem.get("Name"), value=field_elem.text or "")
+        for field_elem in custom_fields_elem.iterchildren("CustomField")
+        if field_elem.get("Name")
+    ]
+
+
+def _unused_tickets(unused_tickets_elem: etree._Element) -> List[UnusedTicket]:
+    return [
+        UnusedTicket(
+            ticket_number=values.get("TicketNumber", ""),
+            airline_code=values.get("AirlineCode", ""),
+            amount=values.get("Amount", ""),
+            currency=values.get("Currency", "USD")
+        )
+        for values in map(_child_texts, unused_tickets_elem.iterchildren("UnusedTicket"))
+    ]
+
+
+def _read_unused_tickets(profile: TravelProfile, unused_tickets_elem: etree._Element) -> None:
+    profile.unused_tickets = _unused_tickets(unused_tickets_elem)
+
+
+def _read_southwest_unused_tickets(profile: TravelProfile, unused_tickets_elem: etree._Element) -> None:
+    profile.southwest_unused_tickets = _unused_tickets(unused_tickets_elem)
+
+
+def _read_memberships(profile: TravelProfile, memberships_elem: etree._Element) -> None:
+    loyalty_programs = []
+    for values in map(_child_texts, memberships_elem.iterchildren("Membership")):
+        vendor_code = values.get("VendorCode", "")
+        vendor_type = values.get("VendorType", "")
+        program_number = values.get("ProgramNumber", "")
+        
+        if vendor_code and vendor_type and program_number:
+            program_type = _LOYALTY_PROGRAM_TYPES.get(vendor_type, LoyaltyProgramType.AIR)
+            
+            loyalty_programs.append(LoyaltyProgram(
+                program_type=program_type,
+                vendor_code=vendor_code,
+                account_number=program_number,
+                expiration=_parse_iso_date(values.get("ExpirationDate"))
+            ))
+    profile.loyalty_programs = loyalty_programs
+
+
+# Travel profile response section tag -> reader filling the profile from that element
+_PROFILE_SECTION_READERS = {
+    "General": _read_general,
+    "HasNoPassport": _read_has_no_passport,
+    "NationalIDs": _read_national_ids,
+    "DriversLicenses": _read_drivers_licenses,
+    "Passports": _read_passports,
+    "Visas": _read_visas,
+    "TSAInfo": _read_tsa_info,
+    "RatePreferences": _read_rate_preferences,
+    "DiscountCodes": _read_discount_codes,
+    "Air": _read_air,
+    "Hotel": _read_hotel,
+    "Car": _read_car,
+    "Rail": _read_rail,
+    "CustomFields": _read_custom_fields,
+    "UnusedTickets": _read_unused_tickets,
+    "SouthwestUnusedTickets": _read_southwest_unused_tickets,
+    "AdvantageMemberships": _read_memberships,
+}
+_PROFILE_SECTION_TAGS = tuple(_PROFILE_SECTION_READERS)
+
+
+def _read_travel_profile(xml_bytes: bytes, login_id: str) -> TravelProfile:
+    """
+    Parse a travel profile response in one iterparse pass
+    
+    Each top-level section is handed to its reader as soon as it is complete
+    and then freed. Only the first occurrence of a section is read.
+    """
+    profile = TravelProfile(login_id=login_id)
+    readers = dict(_PROFILE_SECTION_READERS)
+    
+    events = etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag=_PROFILE_SECTION_TAGS,
+                             remove_blank_text=True, collect_ids=False,
+                             resolve_entities=False, no_network=True, huge_tree=False)
+    for _, elem in events:
+        # Section tags such as Seat or Car can recur inside other sections; those are
+        # read by their enclosing section's reader, so leave them in place
+        parent = elem.getparent()
+        if parent is None or parent.getparent() is not None:
+            continue
+        
+        reader = readers.pop(elem.tag, None)
+        if reader is not None:
+            reader(profile, elem)
+        
+        # Free the finished section and any siblings already processed
+        elem.clear()
+        while elem.getprevious() is not None:
+            del parent[0]
+    
+    return profile
+
+
+@dataclass(slots=True)
+class IdentityPatchOperation:
+    """SCIM 2.0 PATCH operation for Identity v4"""
+    op: str  # "add", "remove", "replace"
+    path: str
+    value: Any = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "op": self.op,
+            "path": self.path
+        }
+        if self.value is not None:
+            result["value"] = self.value
+        return result
+
+
+@dataclass(slots=True)
 class IdentityPatchRequest:
     """SCIM 2.0 PATCH request for Identity v4"""
     operations: List[IdentityPatchOperation]
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "schemas": [SCIMSchemas.PATCH_OP.value],
+            "schemas": [_PATCH_OP],
             "Operations": [op.to_dict() for op in self.operations]
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileSummary:
     """Represents a profile summary from the summary API"""
     status: ProfileStatus
@@ -1242,7 +2141,7 @@ class ProfileSummary:
     profile_last_modified_utc: Optional[datetime] = None
 
 
-@dataclass 
+@dataclass(slots=True)
 class PagingInfo:
     """Represents paging information"""
     total_pages: int = 0
@@ -1253,14 +2152,62 @@ class PagingInfo:
     next_page_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectResponse:
     """Represents a Connect API response for profile summaries"""
     metadata: Optional[PagingInfo] = None
     profile_summaries: List[ProfileSummary] = field(default_factory=list)
+    
+    @classmethod
+    def from_xml_iter(cls, xml_bytes: bytes) -> 'ConnectResponse':
+        """
+        Parse a profile summary page with iterparse
+        
+        Each Paging / ProfileSummary element is converted as soon as it is
+        complete and then freed, so memory stays flat however large the page.
+        """
+        metadata = None
+        summaries = []
+        
+        # Same hardening as _read_travel_profile: no entity expansion, network or huge trees
+        events = etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag=("Paging", "ProfileSummary"),
+                                 collect_ids=False, resolve_entities=False, no_network=True, huge_tree=False)
+        for _, elem in events:
+            if elem.tag == "ProfileSummary":
+                last_modified = None
+                last_modified_str = elem.findtext("ProfileLastModifiedUTC", "")
+                if last_modified_str:
+                    try:
+                        last_modified = datetime.fromisoformat(last_modified_str)
+                    except ValueError:
+                        logger.warning("Could not parse ProfileLastModifiedUTC: %s", last_modified_str)
+                
+                summaries.append(ProfileSummary(
+                    status=_PROFILE_STATUSES.get(elem.findtext("Status", ""), ProfileStatus.INACTIVE),
+                    login_id=elem.findtext("LoginID", ""),
+                    # The schema spells this XMLProfileSyncID, the API sends XmlProfileSyncID
+                    xml_profile_sync_id=elem.findtext("XmlProfileSyncID") or elem.findtext("XMLProfileSyncID", ""),
+                    profile_last_modified_utc=last_modified
+                ))
+            else:
+                metadata = PagingInfo(
+                    total_pages=int(elem.findtext("TotalPages") or 0),
+                    total_items=int(elem.findtext("TotalItems") or 0),
+                    page=int(elem.findtext("Page") or 1),
+                    items_per_page=int(elem.findtext("ItemsPerPage") or 200),
+                    previous_page_url=elem.findtext("PreviousPageURL", ""),
+                    next_page_url=elem.findtext("NextPageURL", "")
+                )
+            
+            # Free the finished element and any siblings already processed
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        
+        return cls(metadata=metadata, profile_summaries=summaries)
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiResponse:
     """Represents a response from the Concur API"""
     success: bool
@@ -1268,10 +2215,23 @@ class ApiResponse:
     profile_id: str = ""
     
     @classmethod
-    def from_xml(cls, xml_str: str) -> 'ApiResponse':
-        """Parse an API response from XML"""
+    def from_xml(cls, xml_data: Union[bytes, str]) -> 'ApiResponse':
+        """Parse an API response from XML (response.content bytes or str)"""
         try:
-            root = etree.fromstring(xml_str.encode('utf-8'))
+            # Short success replies carry everything in the root attributes, so read
+            # them straight from the start tag without building a tree
+            if len(xml_data) <= _FAST_RESPONSE_MAX_LEN:
+                match = _RESPONSE_ROOT_RE.match(_xml_text(xml_data))
+                if match and match.group(1) != "Errors":
+                    attrs = {name: double or single for name, double, single in _RESPONSE_ATTR_RE.findall(match.group(2))}
+                    status = attrs.get("Status", "")
+                    if status == "Success":
+                        return cls(success=True, message="Operation completed successfully",
+                                   profile_id=attrs.get("ProfileID", ""))
+                    if status != "ERROR":
+                        return cls(success=True, message="Operation completed")
+            
+            root = etree.fromstring(_xml_bytes(xml_data), _response_parser())
             
             # Check for error response
             if root.tag == "Errors":
@@ -1293,17 +2253,17 @@ class ApiResponse:
             return cls(success=False, message=f"Failed to parse response: {str(e)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiError:
     """Represents an error from the Concur API"""
     message: str
     code: str = ""
     
     @classmethod
-    def from_xml(cls, xml_str: str) -> 'ApiError':
-        """Parse an API error from XML"""
+    def from_xml(cls, xml_data: Union[bytes, str]) -> 'ApiError':
+        """Parse an API error from XML (response.content bytes or str)"""
         try:
-            root = etree.fromstring(xml_str.encode('utf-8'))
+            root = etree.fromstring(_xml_bytes(xml_data), _response_parser())
             
             # Try different error formats
             if root.tag == "Errors":
@@ -1322,7 +2282,7 @@ class ApiError:
             return cls(message=f"Failed to parse error: {str(e)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class LoyaltyResponse:
     """Represents a loyalty program API response"""
     success: bool
@@ -1330,10 +2290,10 @@ class LoyaltyResponse:
     error: Optional[str] = None
     
     @classmethod
-    def from_xml(cls, xml_str: str) -> 'LoyaltyResponse':
-        """Parse loyalty response from XML"""
+    def from_xml(cls, xml_data: Union[bytes, str]) -> 'LoyaltyResponse':
+        """Parse loyalty response from XML (response.content bytes or str)"""
         try:
-            root = etree.fromstring(xml_str.encode('utf-8'))
+            root = etree.fromstring(_xml_bytes(xml_data), _response_parser())
             status = root.findtext("Status", "")
             
             if status == "ERROR":
@@ -1366,6 +2326,67 @@ class ValidationError(ConcurProfileError):
     pass
 
 
+class TTLCache:
+    """Small LRU cache whose entries expire after a fixed number of seconds
+    
+    Safe to share between threads: every operation holds the cache lock.
+    """
+    
+    __slots__ = ("maxsize", "ttl", "_data", "_lock")
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                self._data.pop(key, None)
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_COMPANY_SCOPED_TOKEN_MESSAGE = (
+    "Company-scoped token detected. "
+    "This token does not provide access to user identity information. "
+    "Please use a user-scoped refresh token or username/password authentication."
+)
+
+
+def _username_filter(username: str) -> str:
+    """SCIM filter matching one userName, with the value escaped as a SCIM string literal"""
+    escaped = username.replace("\\", "\\\\").replace('"', '\\"')
+    return f'userName eq "{escaped}"'
+
+
+def _username_cache_key(username: str) -> str:
+    """User cache key for a userName lookup; SCIM matches userName case-insensitively"""
+    return "userName:" + username.lower()
+
+
 class ConcurSDK:
     """
     Complete SDK for interacting with Concur APIs using Identity v4 + Travel Profile v2
@@ -1387,6 +2408,9 @@ class ConcurSDK:
         username: Concur username for authentication
         password: Concur password for authentication
         base_url: Base URL for Concur API (defaults to US instance)
+        company_id: Company UUID (defaults to CONCUR_COMPANY_UUID environment variable)
+        session: Optional requests.Session to share connections across calls;
+            closed by close() or when leaving a ``with`` block
     
     Example:
         sdk = ConcurSDK(
@@ -1420,6 +2444,10 @@ class ConcurSDK:
             )
         )
         sdk.update_travel_profile(travel_profile)
+        
+        # Or scope a dedicated session to a block of work
+        with ConcurSDK(client_id, client_secret, session=requests.Session()) as sdk:
+            sdk.get_current_user_travel_profile()
     """
     
     def __init__(
@@ -1430,7 +2458,8 @@ class ConcurSDK:
         password: Optional[str] = None,
         refresh_token: Optional[str] = None,
         base_url: str = "https://us2.api.concursolutions.com",
-        company_id: Optional[str] = None
+        company_id: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -1442,8 +2471,21 @@ class ConcurSDK:
         # Set company ID from parameter or environment variable
         self.company_id = company_id or os.getenv('CONCUR_COMPANY_UUID')
         
-        self._access_token: Optional[str] = None
-        self._token_expiry: Optional[datetime] = None
+        # Reuse one session so keep-alive connections survive between API calls
+        self.session = session or _session
+        # Created on first use by the async API methods
+        self._async_client: Optional["httpx.AsyncClient"] = None
+        # Serializes async token requests; created on first use inside the event loop
+        self._auth_lock: Optional[asyncio.Lock] = None
+        # Unknown until the first batched fetch tries the SCIM Bulk endpoint
+        self._bulk_supported: Optional[bool] = None
+        # Set once /me shows the credentials are company-scoped; they cannot become user-scoped
+        self._company_scoped = False
+        
+        # Identity lookups by user ID and userName, reused across calls for five minutes
+        self._user_cache = TTLCache(maxsize=10_000, ttl=300)
+        
+        self._token: Optional[TokenCache] = None
         self._geolocation: Optional[str] = None
         
         # Validate authentication parameters - allow client credentials (no username/password or refresh_token)
@@ -1458,63 +2500,99 @@ class ConcurSDK:
         # Identity v4 endpoint will be constructed using geolocation after auth
         self._identity_base_url: Optional[str] = None
     
+    @property
+    def _access_token(self) -> Optional[str]:
+        token = self._token
+        return token.access_token if token is not None else None
+    
     def _ensure_authenticated(self) -> None:
-        """Ensure we have a valid access token"""
-        if not self._access_token or (self._token_expiry and datetime.now() >= self._token_expiry):
+        """Ensure we have an access token that is not within the expiry slop"""
+        # Runs before every request, so compare the deadline inline rather than via is_expired()
+        token = self._token
+        if token is None or time.monotonic() >= token.expires_at:
             self._authenticate()
     
     def _authenticate(self) -> None:
         """Authenticate with Concur API and store access token and geolocation"""
         logger.info("Authenticating with Concur API...")
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "concur-correlationid": "python-concur-sdk"
-        }
+        try:
+            response = self.session.post(self.auth_url, headers=_AUTH_HEADERS, data=self._auth_form())
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise AuthenticationError(f"Authentication failed: {e}") from e
+        
+        self._store_auth_response(_json_loads(response.content))
+    
+    async def _aensure_authenticated(self) -> None:
+        """Async version of _ensure_authenticated"""
+        token = self._token
+        if token is None or time.monotonic() >= token.expires_at:
+            await self._aauthenticate()
+    
+    async def _aauthenticate(self, rejected_token: Optional[str] = None) -> None:
+        """
+        Async version of _authenticate, sent on the async client
+        
+        Concurrent callers queue on one lock and only the first fetches a token;
+        the rest find a fresh one when they get the lock. rejected_token is the
+        access token a request was refused with, so a 401 forces a new token
+        even when the current one has not reached its deadline.
+        """
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
         
+        async with self._auth_lock:
+            token = self._token
+            if (token is not None and token.access_token != rejected_token
+                    and time.monotonic() < token.expires_at):
+                return
+            
+            logger.info("Authenticating with Concur API...")
+            
+            client = self._get_async_client()
+            try:
+                response = await client.post(self.auth_url, headers=_AUTH_HEADERS, data=self._auth_form())
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise AuthenticationError(f"Authentication failed: {e}") from e
+            
+            self._store_auth_response(_json_loads(response.content))
+    
+    def _auth_form(self) -> Dict[str, str]:
+        """Token request form for the configured credentials"""
         # Choose authentication method based on available parameters
         if self.refresh_token:
-            data = {
+            return {
                 "client_id": self.client_id,
                 "client_secret": self.client_secret,
                 "grant_type": "refresh_token",
                 "refresh_token": self.refresh_token
             }
-        elif self.username and self.password:
-            data = {
+        if self.username and self.password:
+            return {
                 "client_id": self.client_id,
                 "client_secret": self.client_secret,
                 "grant_type": "password",
                 "username": self.username,
                 "password": self.password
             }
-        else:
-            # Use client credentials grant as fallback
-            data = {
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "grant_type": "client_credentials"
-            }
+        # Use client credentials grant as fallback
+        return {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "grant_type": "client_credentials"
+        }
+    
+    def _store_auth_response(self, auth_data: AuthResponse) -> None:
+        """Keep the token and geolocation from a successful token response"""
+        self._token = TokenCache.from_auth_response(auth_data)
+        self._geolocation = auth_data["geolocation"]
         
-        try:
-            response = requests.post(self.auth_url, headers=headers, data=data)
-            response.raise_for_status()
-            
-            auth_data: AuthResponse = response.json()
-            self._access_token = auth_data["access_token"]
-            self._geolocation = auth_data["geolocation"]
-            
-            # Set up Identity v4 endpoint using geolocation
-            self._identity_base_url = f"{self._geolocation}/profile/identity/v4"
-            
-            # Calculate token expiry (subtract 60 seconds for safety)
-            expires_in = auth_data["expires_in"] - 60
-            self._token_expiry = datetime.now().replace(microsecond=0) + timedelta(seconds=expires_in)
-            
-            logger.info(f"Authentication successful! Geolocation: {self._geolocation}")
-            
-        except requests.exceptions.RequestException as e:
-            raise AuthenticationError(f"Authentication failed: {str(e)}")
+        # Set up Identity v4 endpoint using geolocation
+        self._identity_base_url = f"{self._geolocation}/profile/identity/v4"
+        
+        logger.info("Authentication successful! Geolocation: %s", self._geolocation)
     
     def _make_identity_request(
         self,
@@ -1537,10 +2615,10 @@ class ConcurSDK:
             "Accept": "application/json"
         }
         
-        json_data = json.dumps(data) if data else None
+        json_data = _json_dumps(data) if data else None
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -1553,7 +2631,7 @@ class ConcurSDK:
                 # Try to re-authenticate once
                 self._authenticate()
                 headers["Authorization"] = f"Bearer {self._access_token}"
-                response = requests.request(
+                response = self.session.request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -1564,13 +2642,13 @@ class ConcurSDK:
             return response
             
         except requests.exceptions.RequestException as e:
-            raise ConcurProfileError(f"Identity API request failed: {str(e)}")
+            raise ConcurProfileError(f"Identity API request failed: {e}") from e
     
     def _make_travel_profile_request(
         self,
         method: str,
         url: str,
-        data: Optional[str] = None,
+        data: Optional[Union[str, bytes]] = None,
         params: Optional[Dict[str, str]] = None
     ) -> requests.Response:
         """Make an authenticated request to the Travel Profile v2 API"""
@@ -1585,7 +2663,7 @@ class ConcurSDK:
             headers["Content-Type"] = "application/xml"
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -1598,7 +2676,7 @@ class ConcurSDK:
                 # Try to re-authenticate once
                 self._authenticate()
                 headers["Authorization"] = f"Bearer {self._access_token}"
-                response = requests.request(
+                response = self.session.request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -1609,35 +2687,152 @@ class ConcurSDK:
             return response
             
         except requests.exceptions.RequestException as e:
-            raise ConcurProfileError(f"Travel Profile API request failed: {str(e)}")
+            raise ConcurProfileError(f"Travel Profile API request failed: {e}") from e
+    
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Return the pooled HTTP/2 client used by the async API methods"""
+        if httpx is None:
+            raise ConcurProfileError("Async API methods require httpx: pip install 'httpx[http2]'")
+        
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=30
+            )
+        return self._async_client
+    
+    def close(self) -> None:
+        """Close the HTTP session passed to this SDK
+        
+        The module-level default session is shared by every ConcurSDK built
+        without one, so it is left open. Use aclose() for the async client.
+        """
+        if self.session is not _session:
+            self.session.close()
+    
+    def __enter__(self) -> 'ConcurSDK':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client if one was created"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        # The lock belongs to the loop that used it; a later loop gets a new one
+        self._auth_lock = None
+    
+    def clear_cache(self) -> None:
+        """Drop all cached user identities"""
+        self._user_cache.clear()
+    
+    async def _arequest(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        **kwargs: Any
+    ) -> "httpx.Response":
+        """Send a request with the current token on the async client, re-authenticating once on 401"""
+        client = self._get_async_client()
+        access_token = self._access_token
+        headers["Authorization"] = f"Bearer {access_token}"
+        response = await client.request(method, url, headers=headers, **kwargs)
+        
+        if response.status_code == 401:
+            await self._aauthenticate(rejected_token=access_token)
+            headers["Authorization"] = f"Bearer {self._access_token}"
+            response = await client.request(method, url, headers=headers, **kwargs)
+        
+        return response
+    
+    async def _amake_identity_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> "httpx.Response":
+        """Async version of _make_identity_request"""
+        await self._aensure_authenticated()
+        
+        if not self._identity_base_url:
+            raise AuthenticationError("Identity base URL not available - authentication may have failed")
+        
+        url = f"{self._identity_base_url}/{endpoint.lstrip('/')}"
+        
+        # _arequest adds the Authorization header
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        
+        json_data = _json_dumps(data) if data else None
+        
+        try:
+            return await self._arequest(method, url, headers, content=json_data, params=params)
+        except httpx.HTTPError as e:
+            raise ConcurProfileError(f"Identity API request failed: {e}") from e
+    
+    async def _amake_travel_profile_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Union[str, bytes]] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> "httpx.Response":
+        """Async version of _make_travel_profile_request"""
+        await self._aensure_authenticated()
+        
+        # _arequest adds the Authorization header
+        headers = {
+            "Accept": "application/xml"
+        }
+        
+        if method == "POST" and data:
+            headers["Content-Type"] = "application/xml"
+        
+        try:
+            return await self._arequest(method, url, headers, content=data, params=params)
+        except httpx.HTTPError as e:
+            raise ConcurProfileError(f"Travel Profile API request failed: {e}") from e
     
     # ========================================
     # Identity v4 API Methods (User Management)
     # ========================================
     
-    def _decode_jwt_payload(self, jwt_token: str) -> Dict[str, Any]:
-        """Decode JWT payload without verification (for extracting user info)"""
+    @property
+    def _jwt_claims(self) -> Dict[str, Any]:
+        """Claims of the current access token, decoded once per token"""
+        return self._decode_jwt_payload(self._access_token) if self._access_token else {}
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _decode_jwt_payload(jwt_token: str) -> Dict[str, Any]:
+        """Decode JWT payload without verification (for extracting user info)
+        
+        Results are cached per token string; treat the returned dict as read-only.
+        """
         try:
             # JWT tokens have 3 parts separated by dots: header.payload.signature
             parts = jwt_token.split('.')
             if len(parts) != 3:
                 raise ValueError("Invalid JWT token format")
             
-            # Decode the payload (middle part)
+            # Decode the payload (middle part), restoring the base64 padding JWTs strip
             payload = parts[1]
+            payload += '=' * (-len(payload) % 4)
             
-            # Add padding if needed for base64 decoding
-            padding = 4 - len(payload) % 4
-            if padding != 4:
-                payload += '=' * padding
-            
-            # Decode base64 and parse JSON
-            decoded_bytes = base64.urlsafe_b64decode(payload)
-            payload_data = json.loads(decoded_bytes.decode('utf-8'))
+            # Decode base64 and parse JSON straight from the bytes
+            decoded_bytes = (pybase64 or base64).urlsafe_b64decode(payload)
+            payload_data = _json_loads(decoded_bytes)
             
             return payload_data
         except Exception as e:
-            logger.warning(f"Failed to decode JWT token: {e}")
+            logger.warning("Failed to decode JWT token: %s", e)
             return {}
     
     def get_current_user_identity(self) -> IdentityUser:
@@ -1652,6 +2847,9 @@ class ConcurSDK:
             ValidationError: If the response cannot be parsed
             AuthenticationError: If token lacks user access permissions
         """
+        if self._company_scoped:
+            raise AuthenticationError(_COMPANY_SCOPED_TOKEN_MESSAGE)
+        
         logger.info("Getting identity for current user")
         
         # Try the /me endpoint first
@@ -1659,8 +2857,8 @@ class ConcurSDK:
             response = self._make_identity_request("GET", "me")
         
             if response.status_code == 200:
-                user_data = response.json()
-                logger.debug(f"Current user data from /me endpoint: {user_data}")
+                user_data = _json_loads(response.content)
+                logger.debug("Current user data from /me endpoint: %s", user_data)
         
                 # Check if this is a User resource or Company resource
                 resource_type = user_data.get('meta', {}).get('resourceType', '')
@@ -1673,21 +2871,17 @@ class ConcurSDK:
                     logger.info("Got Company resource from /me, extracting user ID from JWT token")
                     
                     if self._access_token:
-                        jwt_payload = self._decode_jwt_payload(self._access_token)
-                        user_id = jwt_payload.get('sub')
+                        user_id = self._jwt_claims.get('sub')
                         
                         if user_id:
-                            logger.info(f"Attempting to get user by ID from JWT: {user_id}")
+                            logger.info("Attempting to get user by ID from JWT: %s", user_id)
                             try:
                                 return self.get_user_identity_by_id(user_id)
                             except ProfileNotFoundError:
                                 # The ID from JWT is likely a company ID, not user ID
                                 logger.info("JWT 'sub' field contains company ID, not user ID")
-                                raise AuthenticationError(
-                                    "Company-scoped token detected. "
-                                    "This token does not provide access to user identity information. "
-                                    "Please use a user-scoped refresh token or username/password authentication."
-                                )
+                                self._company_scoped = True
+                                raise AuthenticationError(_COMPANY_SCOPED_TOKEN_MESSAGE)
                         else:
                             raise AuthenticationError("Could not extract user ID from JWT token")
                     else:
@@ -1711,7 +2905,7 @@ class ConcurSDK:
             raise
         except Exception as e:
             # Wrap other exceptions
-            raise ConcurProfileError(f"Unexpected error getting current user identity: {str(e)}")
+            raise ConcurProfileError(f"Unexpected error getting current user identity: {e}") from e
     
     def get_user_identity_by_id(self, user_id: str) -> IdentityUser:
         """
@@ -1727,14 +2921,20 @@ class ConcurSDK:
             ProfileNotFoundError: If the user is not found
             ConcurProfileError: If the request fails
         """
-        logger.info(f"Getting user identity by ID: {user_id}")
+        cached_user = self._user_cache.get(user_id)
+        if cached_user is not None:
+            return cached_user
+        
+        logger.info("Getting user identity by ID: %s", user_id)
         
         try:
             response = self._make_identity_request("GET", f"Users/{user_id}")
             
             if response.status_code == 200:
-                user_data = response.json()
-                return IdentityUser.from_identity_response(user_data)
+                user_data = _json_loads(response.content)
+                user = IdentityUser.from_identity_response(user_data)
+                self._user_cache.set(user_id, user)
+                return user
             elif response.status_code == 404:
                 raise ProfileNotFoundError(f"User not found: {user_id}")
             else:
@@ -1746,7 +2946,7 @@ class ConcurSDK:
         except ProfileNotFoundError:
             raise
         except Exception as e:
-            raise ConcurProfileError(f"Error getting user by ID {user_id}: {str(e)}")
+            raise ConcurProfileError(f"Error getting user by ID {user_id}: {e}") from e
     
     def find_user_by_username(self, username: str) -> Optional[IdentityUser]:
         """
@@ -1761,27 +2961,34 @@ class ConcurSDK:
         Raises:
             ConcurProfileError: If the request fails
         """
-        logger.info(f"Finding user by username: {username}")
+        cache_key = _username_cache_key(username)
+        cached_user = self._user_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+        
+        logger.info("Finding user by username: %s", username)
         
         try:
             # Use SCIM filter to search by userName
             params = {
-                "filter": f'userName eq "{username}"'
+                "filter": _username_filter(username)
             }
             response = self._make_identity_request("GET", "Users", params=params)
             
             if response.status_code == 200:
-                search_results = response.json()
+                search_results = _json_loads(response.content)
                 resources = search_results.get('Resources', [])
                 
                 if len(resources) == 0:
                     return None  # Return None instead of raising exception
-                elif len(resources) == 1:
-                    return IdentityUser.from_identity_response(resources[0])
-                else:
+                if len(resources) > 1:
                     # Multiple results - return the first one
-                    logger.warning(f"Multiple users found for username {username}, returning first result")
-                    return IdentityUser.from_identity_response(resources[0])
+                    logger.warning("Multiple users found for username %s, returning first result", username)
+                user = IdentityUser.from_identity_response(resources[0])
+                # Misses are not cached, so a user created later is found on the next lookup
+                self._user_cache.set(cache_key, user)
+                self._user_cache.set(user.id, user)
+                return user
             else:
                 error_msg = f"Failed to search for user {username}: HTTP {response.status_code}"
                 if response.text:
@@ -1791,7 +2998,188 @@ class ConcurSDK:
         except ConcurProfileError:
             raise
         except Exception as e:
-            raise ConcurProfileError(f"Error finding user by username {username}: {str(e)}")
+            raise ConcurProfileError(f"Error finding user by username {username}: {e}") from e
+    
+    async def aget_user_identity_by_id(self, user_id: str) -> IdentityUser:
+        """
+        Async version of get_user_identity_by_id for use with asyncio.gather
+        
+        Args:
+            user_id: The unique ID of the user
+            
+        Returns:
+            IdentityUser object containing user identity information
+            
+        Raises:
+            ProfileNotFoundError: If the user is not found
+            ConcurProfileError: If the request fails
+        """
+        cached_user = self._user_cache.get(user_id)
+        if cached_user is not None:
+            return cached_user
+        
+        logger.info("Getting user identity by ID: %s", user_id)
+        
+        try:
+            response = await self._amake_identity_request("GET", f"Users/{user_id}")
+            
+            if response.status_code == 200:
+                user = IdentityUser.from_identity_response(_json_loads(response.content))
+                self._user_cache.set(user_id, user)
+                return user
+            elif response.status_code == 404:
+                raise ProfileNotFoundError(f"User not found: {user_id}")
+            else:
+                error_msg = f"Failed to get user {user_id}: HTTP {response.status_code}"
+                if response.text:
+                    error_msg += f" - {response.text}"
+                raise ConcurProfileError(error_msg)
+                
+        except ProfileNotFoundError:
+            raise
+        except Exception as e:
+            raise ConcurProfileError(f"Error getting user by ID {user_id}: {e}") from e
+    
+    async def afind_user_by_username(self, username: str) -> Optional[IdentityUser]:
+        """
+        Async version of find_user_by_username
+        
+        Args:
+            username: The username to search for
+            
+        Returns:
+            IdentityUser object, or None if not found
+            
+        Raises:
+            ConcurProfileError: If the request fails
+        """
+        cache_key = _username_cache_key(username)
+        cached_user = self._user_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+        
+        logger.info("Finding user by username: %s", username)
+        
+        try:
+            params = {
+                "filter": _username_filter(username)
+            }
+            response = await self._amake_identity_request("GET", "Users", params=params)
+            
+            if response.status_code == 200:
+                resources = _json_loads(response.content).get('Resources', [])
+                
+                if not resources:
+                    return None
+                if len(resources) > 1:
+                    logger.warning("Multiple users found for username %s, returning first result", username)
+                user = IdentityUser.from_identity_response(resources[0])
+                self._user_cache.set(cache_key, user)
+                self._user_cache.set(user.id, user)
+                return user
+            else:
+                error_msg = f"Failed to search for user {username}: HTTP {response.status_code}"
+                if response.text:
+                    error_msg += f" - {response.text}"
+                raise ConcurProfileError(error_msg)
+                
+        except ConcurProfileError:
+            raise
+        except Exception as e:
+            raise ConcurProfileError(f"Error finding user by username {username}: {e}") from e
+    
+    async def fetch_users_batched(self, user_ids: List[str], batch: int = 25) -> List[IdentityUser]:
+        """
+        Fetch many user identities, batch users per request where possible
+        
+        Each chunk of user IDs is sent as one SCIM Bulk request. If the Bulk
+        endpoint is not available, users are fetched individually with at most
+        `batch` requests in flight.
+        
+        Args:
+            user_ids: The unique IDs of the users to fetch
+            batch: Number of users per Bulk request / concurrent single requests
+            
+        Returns:
+            IdentityUser objects in the same order as user_ids
+            
+        Raises:
+            ProfileNotFoundError: If any user is not found
+            ConcurProfileError: If a request fails
+        """
+        logger.info("Fetching %d user identities in batches of %d", len(user_ids), batch)
+        
+        users: Dict[str, IdentityUser] = {}
+        for user_id in user_ids:
+            cached_user = self._user_cache.get(user_id)
+            if cached_user is not None:
+                users[user_id] = cached_user
+        
+        uncached_ids = [user_id for user_id in user_ids if user_id not in users]
+        chunks = [uncached_ids[i:i + batch] for i in range(0, len(uncached_ids), batch)]
+        
+        if self._bulk_supported is not False:
+            for chunk in chunks:
+                bulk_users = await self._afetch_users_bulk(chunk)
+                if bulk_users is None:
+                    break
+                users.update(bulk_users)
+        
+        if self._bulk_supported is False:
+            semaphore = asyncio.Semaphore(batch)
+            
+            async def fetch_one(user_id: str) -> IdentityUser:
+                async with semaphore:
+                    return await self.aget_user_identity_by_id(user_id)
+            
+            # Collect not-found users into the missing list below instead of letting the
+            # first 404 abandon the other requests; key results by the requested ID
+            remaining = [user_id for user_id in user_ids if user_id not in users]
+            results = await asyncio.gather(*[fetch_one(user_id) for user_id in remaining], return_exceptions=True)
+            for user_id, result in zip(remaining, results):
+                if isinstance(result, ProfileNotFoundError):
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                users[user_id] = result
+        
+        missing = [user_id for user_id in user_ids if user_id not in users]
+        if missing:
+            raise ProfileNotFoundError(f"Users not found: {', '.join(missing)}")
+        
+        return [users[user_id] for user_id in user_ids]
+    
+    async def _afetch_users_bulk(self, user_ids: List[str]) -> Optional[Dict[str, IdentityUser]]:
+        """Fetch one chunk of users through SCIM Bulk, or return None if Bulk is unsupported"""
+        bulk_request = {
+            "schemas": [_BULK_REQUEST],
+            "Operations": [
+                {"method": "GET", "bulkId": user_id, "path": f"/Users/{user_id}"}
+                for user_id in user_ids
+            ]
+        }
+        
+        response = await self._amake_identity_request("POST", "Bulk", data=bulk_request)
+        
+        if response.status_code in (404, 405, 501):
+            logger.info("SCIM Bulk endpoint not available, falling back to individual requests")
+            self._bulk_supported = False
+            return None
+        if response.status_code != 200:
+            error_msg = f"Bulk user request failed: HTTP {response.status_code}"
+            if response.text:
+                error_msg += f" - {response.text}"
+            raise ConcurProfileError(error_msg)
+        
+        self._bulk_supported = True
+        users = {}
+        for operation in _json_loads(response.content).get("Operations", []):
+            if str(operation.get("status")) == "200" and operation.get("response"):
+                user = IdentityUser.from_identity_response(operation["response"])
+                user_id = operation.get("bulkId") or user.id
+                self._user_cache.set(user_id, user)
+                users[user_id] = user
+        return users
     
     def create_user_identity(self, user: IdentityUser) -> IdentityUser:
         """
@@ -1804,33 +3192,35 @@ class ConcurSDK:
             IdentityUser object containing the created user information
             
         Raises:
-            ValidationError: If the user data is invalid
+            ValidationError: If the company ID is missing or an email or phone number is malformed
             ConcurProfileError: If the request fails
         """
-        logger.info(f"Creating user identity: {user.user_name}")
+        # Validate that we have a company ID before touching the user or serializing it
+        company_id = (user.enterprise_info.company_id if user.enterprise_info else "") or self.company_id
+        if not company_id:
+            raise ValidationError(
+                "Company ID is required for user creation. "
+                "Set the CONCUR_COMPANY_UUID environment variable or provide company_id parameter."
+            )
+        user.validate()
+        
+        logger.info("Creating user identity: %s", user.user_name)
         
         try:
-            # Ensure the user has enterprise info with company ID
+            # Ensure the user has enterprise info with company ID, from SDK configuration if not already provided
             if not user.enterprise_info:
                 user.enterprise_info = IdentityEnterpriseInfo()
-            
-            # Ensure company ID is set from SDK configuration if not already provided
-            if not user.enterprise_info.company_id and self.company_id:
-                user.enterprise_info.company_id = self.company_id
-            
-            # Validate that we have a company ID
-            if not user.enterprise_info.company_id:
-                raise ValidationError(
-                    "Company ID is required for user creation. "
-                    "Set the CONCUR_COMPANY_UUID environment variable or provide company_id parameter."
-                )
+            user.enterprise_info.company_id = company_id
             
             user_data = user.to_create_dict()
             response = self._make_identity_request("POST", "Users", data=user_data)
             
             if response.status_code == 201:
-                created_user_data = response.json()
-                return IdentityUser.from_identity_response(created_user_data)
+                created_user_data = _json_loads(response.content)
+                created_user = IdentityUser.from_identity_response(created_user_data)
+                self._user_cache.pop(created_user.id, None)
+                self._user_cache.pop(_username_cache_key(created_user.user_name), None)
+                return created_user
             else:
                 error_msg = f"Failed to create user {user.user_name}: HTTP {response.status_code}"
                 if response.text:
@@ -1838,7 +3228,7 @@ class ConcurSDK:
                 raise ConcurProfileError(error_msg)
                 
         except Exception as e:
-            raise ConcurProfileError(f"Error creating user {user.user_name}: {str(e)}")
+            raise ConcurProfileError(f"Error creating user {user.user_name}: {e}") from e
     
     # ========================================
     # Travel Profile v2 API Methods
@@ -1879,22 +3269,23 @@ class ConcurSDK:
             ProfileNotFoundError: If the travel profile is not found
             ConcurProfileError: If the request fails
         """
-        logger.info(f"Getting travel profile for user: {login_id}")
+        logger.info("Getting travel profile for user: %s", login_id)
         
         try:
             # URL encode the login ID for the API request
-            encoded_login_id = urllib.parse.quote(login_id, safe='')
+            from urllib.parse import quote
+            encoded_login_id = quote(login_id, safe='')
             
             # Make the API request
             url = f"{self.travel_profile_url}?userid={encoded_login_id}"
             response = self._make_travel_profile_request("GET", url)
             
             if response.status_code == 200:
-                xml_content = response.text
-                logger.debug(f"Travel profile XML response: {xml_content[:500]}...")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Travel profile XML response: %s...", response.content[:500].decode("utf-8", "replace"))
                 
                 # Parse the XML response into a TravelProfile object
-                return self._parse_travel_profile_xml(xml_content, login_id)
+                return self._parse_travel_profile_xml(response.content, login_id)
                 
             elif response.status_code == 404:
                 raise ProfileNotFoundError(f"Travel profile not found for user: {login_id}")
@@ -1907,338 +3298,107 @@ class ConcurSDK:
         except ProfileNotFoundError:
             raise
         except Exception as e:
-            raise ConcurProfileError(f"Error getting travel profile for {login_id}: {str(e)}")
+            raise ConcurProfileError(f"Error getting travel profile for {login_id}: {e}") from e
     
-    def _parse_travel_profile_xml(self, xml_content: str, login_id: str) -> TravelProfile:
-        """Parse travel profile XML response into TravelProfile object"""
-        try:
-            # Parse the XML
-            root = etree.fromstring(xml_content.encode('utf-8'))
-            
-            # Create the base travel profile object
-            profile = TravelProfile(login_id=login_id)
-            
-            # Parse General section
-            general_elem = root.find("General")
-            if general_elem is not None:
-                profile.rule_class = general_elem.findtext("RuleClass", "")
-                profile.travel_config_id = general_elem.findtext("TravelConfigID", "")
-            
-            # Parse HasNoPassport flag
-            has_no_passport = root.findtext("HasNoPassport", "false")
-            profile.has_no_passport = has_no_passport.lower() == "true"
-            
-            # Parse National IDs
-            national_ids_elem = root.find("NationalIDs")
-            if national_ids_elem is not None:
-                for id_elem in national_ids_elem.findall("NationalID"):
-                    national_id = NationalID(
-                        id_number=id_elem.findtext("NationalIDNumber", ""),
-                        country_code=id_elem.findtext("IssuingCountry", "")
-                    )
-                    profile.national_ids.append(national_id)
-            
-            # Parse Driver's Licenses
-            licenses_elem = root.find("DriversLicenses")
-            if licenses_elem is not None:
-                for license_elem in licenses_elem.findall("DriversLicense"):
-                    license = DriversLicense(
-                        license_number=license_elem.findtext("DriversLicenseNumber", ""),
-                        country_code=license_elem.findtext("IssuingCountry", ""),
-                        state_province=license_elem.findtext("IssuingState", "")
-                    )
-                    profile.drivers_licenses.append(license)
-            
-            # Parse Passports
-            passports_elem = root.find("Passports")
-            if passports_elem is not None:
-                for passport_elem in passports_elem.findall("Passport"):
-                    issue_date = None
-                    expiration_date = None
-                    
-                    issue_date_str = passport_elem.findtext("PassportDateIssued")
-                    if issue_date_str:
-                        try:
-                            issue_date = datetime.strptime(issue_date_str, "%Y-%m-%d").date()
-                        except:
-                            pass
-                    
-                    expiration_date_str = passport_elem.findtext("PassportExpiration")
-                    if expiration_date_str:
-                        try:
-                            expiration_date = datetime.strptime(expiration_date_str, "%Y-%m-%d").date()
-                        except:
-                            pass
-                    
-                    passport = Passport(
-                        doc_number=passport_elem.findtext("PassportNumber", ""),
-                        nationality=passport_elem.findtext("PassportNationality", ""),
-                        issue_country=passport_elem.findtext("PassportCountryIssued", ""),
-                        issue_date=issue_date,
-                        expiration_date=expiration_date
-                    )
-                    profile.passports.append(passport)
-            
-            # Parse Visas
-            visas_elem = root.find("Visas")
-            if visas_elem is not None:
-                for visa_elem in visas_elem.findall("Visa"):
-                    visa_date_issued = None
-                    visa_expiration = None
-                    
-                    date_issued_str = visa_elem.findtext("VisaDateIssued")
-                    if date_issued_str:
-                        try:
-                            visa_date_issued = datetime.strptime(date_issued_str, "%Y-%m-%d").date()
-                        except:
-                            pass
-                    
-                    expiration_str = visa_elem.findtext("VisaExpiration")
-                    if expiration_str:
-                        try:
-                            visa_expiration = datetime.strptime(expiration_str, "%Y-%m-%d").date()
-                        except:
-                            pass
-                    
-                    visa_type_str = visa_elem.findtext("VisaType", "Unknown")
-                    try:
-                        visa_type = VisaType(visa_type_str)
-                    except ValueError:
-                        visa_type = VisaType.UNKNOWN
-                    
-                    visa = Visa(
-                        visa_nationality=visa_elem.findtext("VisaNationality", ""),
-                        visa_number=visa_elem.findtext("VisaNumber", ""),
-                        visa_type=visa_type,
-                        visa_country_issued=visa_elem.findtext("VisaCountryIssued", ""),
-                        visa_date_issued=visa_date_issued,
-                        visa_expiration=visa_expiration
-                    )
-                    profile.visas.append(visa)
-            
-            # Parse TSA Info
-            tsa_elem = root.find("TSAInfo")
-            if tsa_elem is not None:
-                dob = None
-                dob_str = tsa_elem.findtext("DateOfBirth")
-                if dob_str:
-                    try:
-                        dob = datetime.strptime(dob_str, "%Y-%m-%d").date()
-                    except:
-                        pass
-                
-                no_middle_name = tsa_elem.findtext("NoMiddleName", "false").lower() == "true"
-                
-                profile.tsa_info = TSAInfo(
-                    known_traveler_number=tsa_elem.findtext("PreCheckNumber", ""),
-                    gender=tsa_elem.findtext("Gender", ""),
-                    date_of_birth=dob,
-                    redress_number=tsa_elem.findtext("RedressNumber", ""),
-                    no_middle_name=no_middle_name
-                )
-            
-            # Parse Rate Preferences
-            rate_prefs_elem = root.find("RatePreferences")
-            if rate_prefs_elem is not None:
-                profile.rate_preferences = RatePreference(
-                    aaa_rate=rate_prefs_elem.findtext("AAARate", "false").lower() == "true",
-                    aarp_rate=rate_prefs_elem.findtext("AARPRate", "false").lower() == "true",
-                    govt_rate=rate_prefs_elem.findtext("GovtRate", "false").lower() == "true",
-                    military_rate=rate_prefs_elem.findtext("MilitaryRate", "false").lower() == "true"
-                )
+    async def aget_travel_profile(self, login_id: str) -> TravelProfile:
+        """
+        Async version of get_travel_profile for use with asyncio.gather
+        
+        Args:
+            login_id: The login ID of the user
+             
+        Returns:
+            TravelProfile object containing travel profile information
             
-            # Parse Discount Codes
-            discount_codes_elem = root.find("DiscountCodes")
-            if discount_codes_elem is not None:
-                for code_elem in discount_codes_elem.findall("DiscountCode"):
-                    vendor = code_elem.get("Vendor", "")
-                    code = code_elem.text or ""
-                    if vendor and code:
-                        profile.discount_codes.append(DiscountCode(vendor=vendor, code=code))
-            
-            # Parse Air Preferences
-            air_elem = root.find("Air")
-            if air_elem is not None:
-                air_prefs = AirPreferences()
-                
-                # Parse seat preferences
-                seat_elem = air_elem.find("Seat")
-                if seat_elem is not None:
-                    inter_row = seat_elem.findtext("InterRowPositionCode", "")
-                    section = seat_elem.findtext("SectionPositionCode", "")
-                    
-                    if inter_row:
-                        try:
-                            air_prefs.seat_preference = SeatPreference(inter_row)
-                        except ValueError:
-                            pass
-                    
-                    if section:
-                        try:
-                            air_prefs.seat_section = SeatSection(section)
-                        except ValueError:
-                            pass
-                
-                # Parse meal preference
-                meal_code = air_elem.findtext("MealCode", "")
-                if meal_code:
-                    try:
-                        air_prefs.meal_preference = MealType(meal_code)
-                    except ValueError:
-                        pass
-                
-                air_prefs.home_airport = air_elem.findtext("HomeAirport", "")
-                air_prefs.air_other = air_elem.findtext("AirOther", "")
-                
-                profile.air_preferences = air_prefs
+        Raises:
+            ProfileNotFoundError: If the travel profile is not found
+            ConcurProfileError: If the request fails
+        """
+        logger.info("Getting travel profile for user: %s", login_id)
+        
+        try:
+            from urllib.parse import quote
+            encoded_login_id = quote(login_id, safe='')
+            url = f"{self.travel_profile_url}?userid={encoded_login_id}"
+            response = await self._amake_travel_profile_request("GET", url)
             
-            # Parse Hotel Preferences
-            hotel_elem = root.find("Hotel")
-            if hotel_elem is not None:
-                hotel_prefs = HotelPreferences()
-                
-                room_type = hotel_elem.findtext("RoomType", "")
-                if room_type:
-                    try:
-                        hotel_prefs.room_type = HotelRoomType(room_type)
-                    except ValueError:
-                        pass
-                
-                hotel_prefs.hotel_other = hotel_elem.findtext("HotelOther", "")
-                hotel_prefs.prefer_foam_pillows = hotel_elem.findtext("PreferFoamPillows", "false") == "true"
-                hotel_prefs.prefer_crib = hotel_elem.findtext("PreferCrib", "false") == "true"
-                hotel_prefs.prefer_rollaway_bed = hotel_elem.findtext("PreferRollawayBed", "false") == "true"
-                hotel_prefs.prefer_gym = hotel_elem.findtext("PreferGym", "false") == "true"
-                hotel_prefs.prefer_pool = hotel_elem.findtext("PreferPool", "false") == "true"
-                hotel_prefs.prefer_room_service = hotel_elem.findtext("PreferRoomService", "false") == "true"
-                hotel_prefs.prefer_early_checkin = hotel_elem.findtext("PreferEarlyCheckIn", "false") == "true"
+            if response.status_code == 200:
+                return self._parse_travel_profile_xml(response.content, login_id)
+            elif response.status_code == 404:
+                raise ProfileNotFoundError(f"Travel profile not found for user: {login_id}")
+            else:
+                error_msg = f"Failed to get travel profile for {login_id}: HTTP {response.status_code}"
+                if response.text:
+                    error_msg += f" - {response.text}"
+                raise ConcurProfileError(error_msg)
                 
-                profile.hotel_preferences = hotel_prefs
+        except ProfileNotFoundError:
+            raise
+        except Exception as e:
+            raise ConcurProfileError(f"Error getting travel profile for {login_id}: {e}") from e
+    
+    def _parse_travel_profile_xml(self, xml_content: Union[bytes, str], login_id: str) -> TravelProfile:
+        """Parse travel profile XML response (response.content bytes or str) into TravelProfile object"""
+        try:
+            profile = _read_travel_profile(_xml_bytes(xml_content), login_id)
             
-            # Parse Car Preferences
-            car_elem = root.find("Car")
-            if car_elem is not None:
-                car_prefs = CarPreferences()
-                
-                car_type = car_elem.findtext("CarType", "")
-                if car_type:
-                    try:
-                        car_prefs.car_type = CarType(car_type)
-                    except ValueError:
-                        pass
-                
-                transmission = car_elem.findtext("CarTransmission", "")
-                if transmission:
-                    try:
-                        car_prefs.transmission = TransmissionType(transmission)
-                    except ValueError:
-                        pass
-                
-                smoking_code = car_elem.findtext("CarSmokingCode", "")
-                if smoking_code:
-                    try:
-                        car_prefs.smoking_preference = SmokingPreference(smoking_code)
-                    except ValueError:
-                        pass
-                
-                car_prefs.gps = car_elem.findtext("CarGPS", "false") == "true"
-                car_prefs.ski_rack = car_elem.findtext("CarSkiRack", "false") == "true"
-                
-                profile.car_preferences = car_prefs
-            
-            # Parse Rail Preferences
-            rail_elem = root.find("Rail")
-            if rail_elem is not None:
-                rail_prefs = RailPreferences(
-                    seat=rail_elem.findtext("Seat", ""),
-                    coach=rail_elem.findtext("Coach", ""),
-                    noise_comfort=rail_elem.findtext("NoiseComfort", ""),
-                    bed=rail_elem.findtext("Bed", ""),
-                    bed_category=rail_elem.findtext("BedCategory", ""),
-                    berth=rail_elem.findtext("Berth", ""),
-                    deck=rail_elem.findtext("Deck", ""),
-                    space_type=rail_elem.findtext("SpaceType", ""),
-                    fare_space_comfort=rail_elem.findtext("FareSpaceComfort", ""),
-                    special_meals=rail_elem.findtext("SpecialMeals", ""),
-                    contingencies=rail_elem.findtext("Contingencies", "")
-                )
-                profile.rail_preferences = rail_prefs
-            
-            # Parse Custom Fields
-            custom_fields_elem = root.find("CustomFields")
-            if custom_fields_elem is not None:
-                for field_elem in custom_fields_elem.findall("CustomField"):
-                    field_name = field_elem.get("Name", "")
-                    field_value = field_elem.text or ""
-                    if field_name:
-                        profile.custom_fields.append(CustomField(field_id=field_name, value=field_value))
-            
-            # Parse Unused Tickets
-            unused_tickets_elem = root.find("UnusedTickets")
-            if unused_tickets_elem is not None:
-                for ticket_elem in unused_tickets_elem.findall("UnusedTicket"):
-                    ticket = UnusedTicket(
-                        ticket_number=ticket_elem.findtext("TicketNumber", ""),
-                        airline_code=ticket_elem.findtext("AirlineCode", ""),
-                        amount=ticket_elem.findtext("Amount", ""),
-                        currency=ticket_elem.findtext("Currency", "USD")
-                    )
-                    profile.unused_tickets.append(ticket)
-            
-            # Parse Southwest Unused Tickets
-            sw_unused_tickets_elem = root.find("SouthwestUnusedTickets")
-            if sw_unused_tickets_elem is not None:
-                for ticket_elem in sw_unused_tickets_elem.findall("UnusedTicket"):
-                    ticket = UnusedTicket(
-                        ticket_number=ticket_elem.findtext("TicketNumber", ""),
-                        airline_code=ticket_elem.findtext("AirlineCode", ""),
-                        amount=ticket_elem.findtext("Amount", ""),
-                        currency=ticket_elem.findtext("Currency", "USD")
-                    )
-                    profile.southwest_unused_tickets.append(ticket)
-            
-            # Parse Advantage Memberships (Loyalty Programs)
-            memberships_elem = root.find("AdvantageMemberships")
-            if memberships_elem is not None:
-                for membership_elem in memberships_elem.findall("Membership"):
-                    vendor_code = membership_elem.findtext("VendorCode", "")
-                    vendor_type = membership_elem.findtext("VendorType", "")
-                    program_number = membership_elem.findtext("ProgramNumber", "")
-                    
-                    if vendor_code and vendor_type and program_number:
-                        # Map vendor type to loyalty program type
-                        program_type_map = {
-                            "Air": LoyaltyProgramType.AIR,
-                            "Hotel": LoyaltyProgramType.HOTEL,
-                            "Car": LoyaltyProgramType.CAR,
-                            "Rail": LoyaltyProgramType.RAIL
-                        }
-                        
-                        program_type = program_type_map.get(vendor_type, LoyaltyProgramType.AIR)
-                        
-                        expiration = None
-                        exp_date_str = membership_elem.findtext("ExpirationDate")
-                        if exp_date_str:
-                            try:
-                                expiration = datetime.strptime(exp_date_str, "%Y-%m-%d").date()
-                            except:
-                                pass
-                        
-                        loyalty_program = LoyaltyProgram(
-                            program_type=program_type,
-                            vendor_code=vendor_code,
-                            account_number=program_number,
-                            expiration=expiration
-                        )
-                        profile.loyalty_programs.append(loyalty_program)
-            
-            logger.info(f"Successfully parsed travel profile for {login_id}")
+            logger.info("Successfully parsed travel profile for %s", login_id)
             return profile
             
         except Exception as e:
-            logger.error(f"Failed to parse travel profile XML: {e}")
-            raise ConcurProfileError(f"Failed to parse travel profile XML response: {str(e)}")
+            logger.error("Failed to parse travel profile XML: %s", e)
+            raise ConcurProfileError(f"Failed to parse travel profile XML response: {e}") from e
 
+    def get_travel_profile_summaries(
+        self,
+        last_modified_date: datetime,
+        page: Optional[int] = None,
+        items_per_page: Optional[int] = None,
+        travel_configs: Optional[List[str]] = None,
+        active: Optional[bool] = None
+    ) -> ConnectResponse:
+        """
+        Get one page of travel profile summaries modified after a date
+        
+        Args:
+            last_modified_date: Only profiles modified after this UTC time are returned
+            page: Page number to fetch (defaults to the first page)
+            items_per_page: Profiles per page, at most 200
+            travel_configs: Optional travel config IDs to filter by
+            active: True for active users only, False for inactive users only
+            
+        Returns:
+            ConnectResponse with paging metadata and the profile summaries
+            
+        Raises:
+            ConcurProfileError: If the request fails
+        """
+        logger.info("Getting travel profile summaries modified since %s", last_modified_date)
+        
+        # Naive YYYY-MM-DDTHH:MM:SS; isoformat skips strftime's format parsing and locale handling
+        params = {"LastModifiedDate": last_modified_date.replace(tzinfo=None).isoformat(timespec="seconds")}
+        if page is not None:
+            params["Page"] = str(page)
+        if items_per_page is not None:
+            params["ItemsPerPage"] = str(items_per_page)
+        if travel_configs:
+            params["travelConfigs"] = ",".join(travel_configs)
+        if active is not None:
+            params["Active"] = "1" if active else "0"
+        
+        response = self._make_travel_profile_request("GET", self.travel_summary_url, params=params)
+        
+        if response.status_code != 200:
+            error_msg = f"Failed to get travel profile summaries: HTTP {response.status_code}"
+            if response.text:
+                error_msg += f" - {response.text}"
+            raise ConcurProfileError(error_msg)
+        
+        try:
+            return ConnectResponse.from_xml_iter(response.content)
+        except etree.XMLSyntaxError as e:
+            raise ConcurProfileError(f"Failed to parse travel profile summaries: {e}") from e
+    
     def update_travel_profile(
         self,
         profile: TravelProfile,
@@ -2260,30 +3420,139 @@ class ConcurSDK:
             ApiResponse with success code
             
         Raises:
-            ValidationError: If login_id is missing
+            ValidationError: If login_id is missing or a passport/visa country code is invalid
             ProfileNotFoundError: If the user is not found
             ConcurProfileError: If the update fails
         """
         if not profile.login_id:
             raise ValidationError("login_id is required for update")
+        profile.validate(fields_to_update)
         
-        logger.info(f"Updating travel profile for user: {profile.login_id}")
+        logger.info("Updating travel profile for user: %s", profile.login_id)
         
-        xml_data = profile.to_update_xml(fields_to_update)
-        logger.debug(f"Generated update XML:\n{xml_data}")
+        xml_data = profile.to_update_bytes(fields_to_update)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated update XML:\n%s", _pretty_xml(xml_data))
         
         response = self._make_travel_profile_request("POST", self.travel_profile_url, data=xml_data)
+        return self._parse_update_response(response, profile.login_id)
+    
+    async def aupdate_travel_profile(
+        self,
+        profile: TravelProfile,
+        fields_to_update: Optional[List[str]] = None
+    ) -> 'ApiResponse':
+        """Async version of update_travel_profile for use with asyncio.gather"""
+        if not profile.login_id:
+            raise ValidationError("login_id is required for update")
+        profile.validate(fields_to_update)
+        
+        logger.info("Updating travel profile for user: %s", profile.login_id)
+        
+        xml_data = profile.to_update_bytes(fields_to_update)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated update XML:\n%s", _pretty_xml(xml_data))
+        
+        response = await self._amake_travel_profile_request("POST", self.travel_profile_url, data=xml_data)
+        return self._parse_update_response(response, profile.login_id)
+    
+    async def update_travel_profiles_bulk(
+        self,
+        profiles: List[TravelProfile],
+        fields_to_update: Optional[List[str]] = None,
+        concurrency: int = 16
+    ) -> List['ApiResponse']:
+        """
+        Update many travel profiles concurrently over the async client
+        
+        Authentication, including a refresh after a 401, is awaited on the
+        async client, so it never blocks the event loop.
+        
+        Args:
+            profiles: TravelProfile objects to update
+            fields_to_update: Optional list of field names to update on every profile
+            concurrency: Maximum number of update requests in flight
+            
+        Returns:
+            ApiResponse objects in the same order as profiles
+            
+        Raises:
+            ValidationError: If a login_id is missing or a passport/visa country code is invalid
+            ProfileNotFoundError: If a user is not found
+            ConcurProfileError: If an update fails
+        """
+        logger.info("Updating %d travel profiles with concurrency %d", len(profiles), concurrency)
         
-        if response.status_code == 404 or "Invalid User" in response.text:
-            raise ProfileNotFoundError(f"User not found: {profile.login_id}")
+        # Fetch the token once up front instead of having every task queue on the auth lock
+        await self._aensure_authenticated()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def update_one(profile: TravelProfile) -> ApiResponse:
+            async with semaphore:
+                return await self.aupdate_travel_profile(profile, fields_to_update)
+        
+        return list(await asyncio.gather(*[update_one(profile) for profile in profiles]))
+    
+    def update_travel_profiles_parallel(
+        self,
+        profiles: List[TravelProfile],
+        fields_to_update: Optional[List[str]] = None,
+        workers: Optional[int] = None
+    ) -> List['ApiResponse']:
+        """
+        Update many travel profiles, serializing them in worker processes
+        
+        The update XML for each profile is built in a ProcessPoolExecutor and
+        the requests are sent one by one from this thread over the pooled
+        session as soon as each body is ready. Starting the pool costs more
+        than serializing a few profiles, so this only pays off above roughly
+        100 profiles per call.
+        
+        Args:
+            profiles: TravelProfile objects to update
+            fields_to_update: Optional list of field names to update on every profile
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            ApiResponse objects in the same order as profiles
+            
+        Raises:
+            ValidationError: If a login_id is missing or a passport/visa country code is invalid
+            ProfileNotFoundError: If a user is not found
+            ConcurProfileError: If an update fails
+        """
+        for profile in profiles:
+            if not profile.login_id:
+                raise ValidationError("login_id is required for update")
+            profile.validate(fields_to_update)
+        
+        logger.info("Updating %d travel profiles with %s serializer processes", len(profiles), workers or "default")
+        
+        serialize = functools.partial(_serialize_update, fields_to_update=fields_to_update)
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map yields bodies in order as the workers finish them, so the first
+            # requests go out while later chunks are still being serialized
+            bodies = executor.map(serialize, profiles, chunksize=32)
+            for profile, xml_data in zip(profiles, bodies):
+                response = self._make_travel_profile_request("POST", self.travel_profile_url, data=xml_data)
+                results.append(self._parse_update_response(response, profile.login_id))
+        return results
+    
+    def _parse_update_response(self, response: Any, login_id: str) -> 'ApiResponse':
+        """Turn a Travel Profile update response (requests or httpx) into an ApiResponse"""
+        if response.status_code == 404 or b"Invalid User" in response.content:
+            raise ProfileNotFoundError(f"User not found: {login_id}")
         
         if response.status_code != 200:
-            logger.error(f"Update failed. Status: {response.status_code}")
-            logger.error(f"Response text: {response.text}")
+            logger.error("Update failed. Status: %s", response.status_code)
+            # response.text may run charset detection over the whole body, so only build it when logged
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Response text: %s", response.text)
             try:
-                error = ApiError.from_xml(response.text)
-                raise ConcurProfileError(f"Failed to update travel profile: {error.message}")
-            except:
-                raise ConcurProfileError(f"Failed to update travel profile: HTTP {response.status_code}")
+                error = ApiError.from_xml(response.content)
+            except Exception as e:
+                raise ConcurProfileError(f"Failed to update travel profile: HTTP {response.status_code}") from e
+            raise ConcurProfileError(f"Failed to update travel profile: {error.message}")
         
-        return ApiResponse.from_xml(response.text)
+        return ApiResponse.from_xml(response.content)
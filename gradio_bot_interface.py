@@ -9,6 +9,7 @@ using Gradio, allowing users to interact with the bot through a chat interface.
 import os
 import sys
 import json
+import logging
 import gradio as gr
 import anthropic
 from datetime import datetime
@@ -964,6 +965,9 @@ def create_interface():
 
 def main():
     """Main function to start the Gradio interface"""
+    # The SDK no longer configures logging itself; keep its INFO output on the console
+    logging.basicConfig(level=logging.INFO)
+    
     print("🚀 Starting Concur Profile Bot Web Interface...")
     
     # Get port from environment (Railway sets this automatically)
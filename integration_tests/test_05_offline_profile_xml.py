@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Offline tests for travel profile XML reading and validation
+
+Tests:
+- A full travel profile response parses into the expected TravelProfile
+- Response dates with and without zero padding, and invalid or empty dates
+- Internal entities in profile and summary responses are not expanded
+- Profiles read back from Concur keep document values the SDK would not send
+- Passport and visa country codes are validated on the update path only
+- Identity emails and phone numbers are validated before a user is created
+
+These tests need no credentials or network access.
+"""
+
+import unittest
+from datetime import date
+
+# Import all necessary classes from the SDK
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from concur_profile_sdk import (
+    TravelProfile, NationalID, DriversLicense, Passport, Visa, TSAInfo, RatePreference,
+    DiscountCode, AirPreferences, HotelPreferences, CarPreferences, RailPreferences,
+    CustomField, UnusedTicket, LoyaltyProgram, IdentityUser, IdentityEmail,
+    IdentityPhoneNumber, Email, EmailType, Phone, PhoneType,
+    VisaType, SeatPreference, SeatSection, MealType, HotelRoomType, CarType,
+    TransmissionType, SmokingPreference, LoyaltyProgramType, ValidationError,
+    ConnectResponse, _read_travel_profile, _parse_iso_date
+)
+
+
+# GET /api/travelprofile/v2.0/profile response with every section the reader handles,
+# plus sections it ignores (Addresses, Telephones, EmailAddresses) and nested tags
+# that share a name with a section (Air/Seat, Rail/Seat)
+FULL_PROFILE_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<ProfileResponse Status="Active" LoginId="traveler@example.com">
+  <General>
+    <FirstName>John</FirstName>
+    <LastName>Doe</LastName>
+    <RuleClass>Default Travel Class</RuleClass>
+    <TravelConfigID>250027436</TravelConfigID>
+  </General>
+  <Addresses>
+    <Address Type="Home">
+      <Street>123 Main St</Street>
+      <CountryCode>US</CountryCode>
+    </Address>
+  </Addresses>
+  <Telephones>
+    <Telephone Type="Home">
+      <PhoneNumber>555-123-4567</PhoneNumber>
+      <Extension />
+    </Telephone>
+  </Telephones>
+  <EmailAddresses>
+    <EmailAddress Type="Business">traveler@example.com</EmailAddress>
+  </EmailAddresses>
+  <NationalIDs>
+    <NationalID>
+      <NationalIDNumber>123-45-6789</NationalIDNumber>
+      <IssuingCountry>US</IssuingCountry>
+    </NationalID>
+  </NationalIDs>
+  <DriversLicenses>
+    <DriversLicense>
+      <DriversLicenseNumber>WDL123</DriversLicenseNumber>
+      <IssuingCountry>US</IssuingCountry>
+      <IssuingState>WA</IssuingState>
+    </DriversLicense>
+  </DriversLicenses>
+  <HasNoPassport>false</HasNoPassport>
+  <Passports>
+    <Passport>
+      <PassportNumber>P1234567</PassportNumber>
+      <PassportNationality>US</PassportNationality>
+      <PassportCountryIssued>US</PassportCountryIssued>
+      <PassportDateIssued>2020-01-15</PassportDateIssued>
+      <PassportExpiration>2030-1-14</PassportExpiration>
+    </Passport>
+  </Passports>
+  <Visas>
+    <Visa>
+      <VisaNationality>US</VisaNationality>
+      <VisaNumber>VISA123</VisaNumber>
+      <VisaType>ME</VisaType>
+      <VisaDateIssued>2021-06-01</VisaDateIssued>
+      <VisaExpiration>2021-02-30</VisaExpiration>
+      <VisaCountryIssued>GB</VisaCountryIssued>
+    </Visa>
+  </Visas>
+  <RatePreferences>
+    <AAARate>true</AAARate>
+    <AARPRate>false</AARPRate>
+    <GovtRate>TRUE</GovtRate>
+    <MilitaryRate>false</MilitaryRate>
+  </RatePreferences>
+  <DiscountCodes>
+    <DiscountCode Vendor="ZE">CDP123</DiscountCode>
+    <DiscountCode Vendor="">skipped</DiscountCode>
+  </DiscountCodes>
+  <Air>
+    <AirMemberships />
+    <Seat>
+      <InterRowPositionCode>Aisle</InterRowPositionCode>
+      <SectionPositionCode>Forward</SectionPositionCode>
+    </Seat>
+    <MealCode>BLML</MealCode>
+    <HomeAirport>SEA</HomeAirport>
+    <AirOther>Exit row &amp; extra legroom</AirOther>
+  </Air>
+  <Rail>
+    <Seat>Window</Seat>
+    <Deck>Upper</Deck>
+    <RailMemberships />
+  </Rail>
+  <Car>
+    <CarType>Compact</CarType>
+    <CarTransmission>Automatic</CarTransmission>
+    <CarSmokingCode>NonSmoking</CarSmokingCode>
+    <CarGPS>true</CarGPS>
+    <CarMemberships />
+  </Car>
+  <Hotel>
+    <HotelMemberships />
+    <RoomType>King</RoomType>
+    <HotelOther>High floor</HotelOther>
+    <PreferGym>true</PreferGym>
+    <PreferPool>false</PreferPool>
+  </Hotel>
+  <CustomFields>
+    <CustomField Name="CostCenter">CC-42</CustomField>
+  </CustomFields>
+  <TSAInfo>
+    <Gender>Male</Gender>
+    <DateOfBirth>1980-02-29</DateOfBirth>
+    <NoMiddleName>false</NoMiddleName>
+    <PreCheckNumber>KTN123</PreCheckNumber>
+    <RedressNumber></RedressNumber>
+  </TSAInfo>
+  <UnusedTickets>
+    <UnusedTicket>
+      <TicketNumber>0012345678901</TicketNumber>
+      <AirlineCode>AA</AirlineCode>
+      <Amount>250.00</Amount>
+    </UnusedTicket>
+  </UnusedTickets>
+  <SouthwestUnusedTickets>
+    <UnusedTicket>
+      <TicketNumber>5262345678901</TicketNumber>
+      <AirlineCode>WN</AirlineCode>
+      <Currency>USD</Currency>
+    </UnusedTicket>
+  </SouthwestUnusedTickets>
+  <AdvantageMemberships>
+    <Membership>
+      <VendorCode>AA</VendorCode>
+      <VendorType>Air</VendorType>
+      <ProgramNumber>AA12345</ProgramNumber>
+      <ExpirationDate>2026-12-31</ExpirationDate>
+    </Membership>
+    <Membership>
+      <VendorCode>MC</VendorCode>
+      <VendorType>Hotel</VendorType>
+      <ProgramNumber></ProgramNumber>
+    </Membership>
+  </AdvantageMemberships>
+</ProfileResponse>
+"""
+
+
+DOCUMENTS_PROFILE_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<ProfileResponse>
+  <Passports>
+    <Passport>
+      <PassportNumber>P1234567</PassportNumber>
+      <PassportNationality>XK</PassportNationality>
+      <PassportCountryIssued>de</PassportCountryIssued>
+    </Passport>
+  </Passports>
+  <Visas>
+    <Visa>
+      <VisaNationality>ZZ</VisaNationality>
+      <VisaNumber>V7654321</VisaNumber>
+      <VisaType>ME</VisaType>
+      <VisaCountryIssued>us</VisaCountryIssued>
+    </Visa>
+  </Visas>
+</ProfileResponse>
+"""
+
+
+class TestReadTravelProfile(unittest.TestCase):
+    """_read_travel_profile turns a profile response into a TravelProfile"""
+    
+    def test_full_profile(self):
+        """Every section of a full response is read into the matching field"""
+        expected = TravelProfile(
+            login_id="traveler@example.com",
+            rule_class="Default Travel Class",
+            travel_config_id="250027436",
+            national_ids=[NationalID(id_number="123-45-6789", country_code="US")],
+            drivers_licenses=[DriversLicense(license_number="WDL123", country_code="US", state_province="WA")],
+            has_no_passport=False,
+            passports=[Passport(doc_number="P1234567", nationality="US", issue_country="US",
+                                issue_date=date(2020, 1, 15), expiration_date=date(2030, 1, 14))],
+            visas=[Visa(visa_nationality="US", visa_number="VISA123", visa_type=VisaType.MULTI_ENTRY,
+                        visa_country_issued="GB", visa_date_issued=date(2021, 6, 1), visa_expiration=None)],
+            tsa_info=TSAInfo(known_traveler_number="KTN123", gender="Male",
+                             date_of_birth=date(1980, 2, 29), redress_number="", no_middle_name=False),
+            rate_preferences=RatePreference(aaa_rate=True, govt_rate=True),
+            discount_codes=[DiscountCode(vendor="ZE", code="CDP123")],
+            air_preferences=AirPreferences(
+                seat_preference=SeatPreference.AISLE,
+                seat_section=SeatSection.FORWARD,
+                meal_preference=MealType.BLAND,
+                home_airport="SEA",
+                air_other="Exit row & extra legroom"
+            ),
+            hotel_preferences=HotelPreferences(room_type=HotelRoomType.KING, hotel_other="High floor",
+                                               prefer_gym=True),
+            car_preferences=CarPreferences(car_type=CarType.COMPACT, transmission=TransmissionType.AUTOMATIC,
+                                           smoking_preference=SmokingPreference.NON_SMOKING, gps=True),
+            rail_preferences=RailPreferences(seat="Window", deck="Upper"),
+            custom_fields=[CustomField(field_id="CostCenter", value="CC-42")],
+            unused_tickets=[UnusedTicket(ticket_number="0012345678901", airline_code="AA", amount="250.00")],
+            southwest_unused_tickets=[UnusedTicket(ticket_number="5262345678901", airline_code="WN")],
+            loyalty_programs=[LoyaltyProgram(program_type=LoyaltyProgramType.AIR, vendor_code="AA",
+                                             account_number="AA12345", expiration=date(2026, 12, 31))]
+        )
+        
+        self.assertEqual(_read_travel_profile(FULL_PROFILE_XML, "traveler@example.com"), expected)
+    
+    def test_empty_profile(self):
+        """A response without sections gives a default profile"""
+        self.assertEqual(_read_travel_profile(b"<ProfileResponse/>", "traveler@example.com"),
+                         TravelProfile(login_id="traveler@example.com"))
+    
+    def test_first_section_wins(self):
+        """Only the first occurrence of a repeated section is read"""
+        xml = (b"<ProfileResponse><General><RuleClass>First</RuleClass></General>"
+               b"<General><RuleClass>Second</RuleClass></General></ProfileResponse>")
+        self.assertEqual(_read_travel_profile(xml, "traveler@example.com").rule_class, "First")
+
+
+
+# Response with nested internal entities that would expand into the parsed text
+ENTITY_SUMMARY_XML = b"""<?xml version="1.0"?>
+<!DOCTYPE ConnectResponse [<!ENTITY a "AAAAAAAA"><!ENTITY b "&a;&a;&a;&a;">]>
+<ConnectResponse>
+  <Data>
+    <ProfileSummary><LoginID>&b;</LoginID><Status>Active</Status></ProfileSummary>
+  </Data>
+</ConnectResponse>
+"""
+
+
+class TestEntityHardening(unittest.TestCase):
+    """Response parsers leave DOCTYPE entities unexpanded"""
+    
+    def test_summary_entities_not_expanded(self):
+        summaries = ConnectResponse.from_xml_iter(ENTITY_SUMMARY_XML).profile_summaries
+        self.assertEqual(len(summaries), 1)
+        self.assertNotIn("AAAA", summaries[0].login_id)
+    
+    def test_profile_entities_not_expanded(self):
+        xml = (b'<?xml version="1.0"?>'
+               b'<!DOCTYPE ProfileResponse [<!ENTITY a "AAAAAAAA"><!ENTITY b "&a;&a;&a;&a;">]>'
+               b'<ProfileResponse><General><RuleClass>&b;</RuleClass></General></ProfileResponse>')
+        self.assertNotIn("AAAA", _read_travel_profile(xml, "traveler@example.com").rule_class)
+
+
+class TestParseIsoDate(unittest.TestCase):
+    """_parse_iso_date accepts the date forms seen in responses and rejects the rest"""
+    
+    def test_padded_dates(self):
+        self.assertEqual(_parse_iso_date("2024-03-05"), date(2024, 3, 5))
+        self.assertEqual(_parse_iso_date("2024-02-29"), date(2024, 2, 29))
+    
+    def test_unpadded_dates(self):
+        self.assertEqual(_parse_iso_date("2024-3-5"), date(2024, 3, 5))
+        self.assertEqual(_parse_iso_date("2024-12-5"), date(2024, 12, 5))
+        self.assertEqual(_parse_iso_date("2024-3-15"), date(2024, 3, 15))
+    
+    def test_invalid_dates(self):
+        for value in ("2024-02-30", "2023-2-29", "2024-13-01", "2024-0-10", "0000-01-01",
+                      "2024-03-05T10:00", "2024/03/05", "05-03-2024", "not a date", " 2024-03-05"):
+            with self.subTest(value=value):
+                self.assertIsNone(_parse_iso_date(value))
+    
+    def test_empty_text(self):
+        self.assertIsNone(_parse_iso_date(""))
+        self.assertIsNone(_parse_iso_date(None))
+
+
+class TestCountryCodeValidation(unittest.TestCase):
+    """Country codes are checked when sending, never when reading"""
+    
+    def test_read_keeps_unvalidated_country_codes(self):
+        """Reading a profile with XK, lower-case and unknown codes does not raise"""
+        profile = _read_travel_profile(DOCUMENTS_PROFILE_XML, "user@example.com")
+    
+        self.assertEqual(profile.passports[0].nationality, "XK")
+        self.assertEqual(profile.passports[0].issue_country, "de")
+        self.assertEqual(profile.visas[0].visa_nationality, "ZZ")
+        self.assertEqual(profile.visas[0].visa_country_issued, "us")
+    
+    def test_validate_accepts_either_case(self):
+        """Lower-case and XK codes pass validation"""
+        profile = TravelProfile(
+            login_id="user@example.com",
+            passports=[Passport(doc_number="P1", nationality="xk", issue_country="de")],
+        )
+        profile.validate()
+    
+    def test_validate_rejects_unknown_code(self):
+        """An unknown code is rejected when its section is being sent"""
+        profile = TravelProfile(
+            login_id="user@example.com",
+            visas=[Visa(visa_nationality="ZZ", visa_number="V1",
+                        visa_type=VisaType.SINGLE_ENTRY, visa_country_issued="US")],
+        )
+        with self.assertRaises(ValidationError):
+            profile.validate()
+        with self.assertRaises(ValidationError):
+            profile.validate(["visas"])
+    
+    def test_validate_skips_sections_not_sent(self):
+        """Documents outside fields_to_update do not block the update"""
+        profile = _read_travel_profile(DOCUMENTS_PROFILE_XML, "user@example.com")
+        profile.validate(["passports", "air_preferences"])
+
+
+
+class TestContactValidation(unittest.TestCase):
+    """Emails and phone numbers are checked on write, not on construction"""
+    
+    def test_construction_does_not_validate(self):
+        """Malformed values can still be held, e.g. when read from a response"""
+        Email(type=EmailType.BUSINESS, email_address="not-an-email")
+        IdentityUser(user_name="user", emails=[IdentityEmail(value="not-an-email")])
+    
+    def test_email_validation(self):
+        """Email addresses must have a local part, a domain and a dot"""
+        IdentityEmail(value="first.last@example.co.uk").validate()
+        for value in ("not-an-email", "a@b", "a b@example.com"):
+            with self.assertRaises(ValidationError):
+                IdentityEmail(value=value).validate()
+            with self.assertRaises(ValidationError):
+                Email(type=EmailType.BUSINESS, email_address=value).validate()
+    
+    def test_phone_validation(self):
+        """Phone numbers are digits with common separators"""
+        for value in ("5551234567", "+1 (555) 123-4567", "555.123.4567"):
+            IdentityPhoneNumber(value=value).validate()
+            Phone(type=PhoneType.WORK, phone_number=value).validate()
+        for value in ("555-CALL-NOW", "+", "555 123 4567 x89"):
+            with self.assertRaises(ValidationError):
+                IdentityPhoneNumber(value=value).validate()
+    
+    def test_user_validate_checks_all_contacts(self):
+        """IdentityUser.validate covers every email and phone number"""
+        user = IdentityUser(
+            user_name="user",
+            emails=[IdentityEmail(value="user@example.com")],
+            phone_numbers=[IdentityPhoneNumber(value="+1 555 123 4567"), IdentityPhoneNumber(value="n/a")],
+        )
+        with self.assertRaises(ValidationError):
+            user.validate()
+
+
+if __name__ == "__main__":
+    unittest.main()
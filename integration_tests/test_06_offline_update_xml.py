@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Offline tests for travel profile update XML generation
+
+Tests:
+- The string writers and the legacy lxml writers produce the same document
+- Escaping of text and the LoginId attribute
+- Empty list sections, HasNoPassport and the General section
+
+These tests need no credentials or network access.
+"""
+
+import unittest
+from datetime import date
+from lxml import etree
+
+# Import all necessary classes from the SDK
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from concur_profile_sdk import (
+    TravelProfile, NationalID, DriversLicense, Passport, Visa, TSAInfo,
+    RatePreference, DiscountCode, AirPreferences, HotelPreferences, CarPreferences,
+    RailPreferences, CustomField, UnusedTicket, LoyaltyProgram,
+    VisaType, SeatPreference, SeatSection, MealType, SmokingPreference, HotelRoomType,
+    CarType, TransmissionType, LoyaltyProgramType
+)
+
+
+# Text that must be escaped in element content and attribute values
+AWKWARD = 'R&D <"Ops"> \'team\''
+
+
+def canonical(xml_text):
+    """C14N form of an update document, so equivalent serializations compare equal"""
+    return etree.tostring(etree.fromstring(xml_text.encode("utf-8")), method="c14n")
+
+
+def full_profile(login_id="traveler@example.com"):
+    """A profile with every update section filled in, including text needing escapes"""
+    membership = LoyaltyProgram(
+        program_type=LoyaltyProgramType.AIR,
+        vendor_code="AA",
+        account_number="A&B-123",
+        status="Gold <1K>",
+        expiration=date(2030, 12, 31)
+    )
+    return TravelProfile(
+        login_id=login_id,
+        rule_class=AWKWARD,
+        travel_config_id="12345",
+        national_ids=[NationalID(id_number="ID<1>", country_code="US")],
+        drivers_licenses=[DriversLicense(license_number="D&1", country_code="US", state_province="WA")],
+        passports=[Passport(doc_number="P1", nationality="US", issue_country="US",
+                            issue_date=date(2020, 1, 2), expiration_date=date(2030, 1, 1))],
+        visas=[Visa(visa_nationality="US", visa_number="V1", visa_type=VisaType.MULTI_ENTRY,
+                    visa_country_issued="GB", visa_date_issued=date(2021, 3, 4))],
+        tsa_info=TSAInfo(known_traveler_number="KT&1", gender="f",
+                         date_of_birth=date(1980, 5, 6), redress_number="R1", no_middle_name=True),
+        rate_preferences=RatePreference(aaa_rate=True, govt_rate=True),
+        discount_codes=[DiscountCode(vendor="ZZ", code=AWKWARD)],
+        air_preferences=AirPreferences(
+            seat_preference=SeatPreference.WINDOW,
+            seat_section=SeatSection.FORWARD,
+            meal_preference=MealType.BLAND,
+            home_airport="SEA",
+            air_other=AWKWARD,
+            memberships=[membership]
+        ),
+        hotel_preferences=HotelPreferences(
+            smoking_preference=SmokingPreference.NON_SMOKING,
+            room_type=HotelRoomType.KING,
+            hotel_other=AWKWARD,
+            prefer_gym=True,
+            prefer_room_service=True
+        ),
+        car_preferences=CarPreferences(
+            car_type=CarType.COMPACT,
+            transmission=TransmissionType.AUTOMATIC,
+            smoking_preference=SmokingPreference.DONT_CARE,
+            gps=True
+        ),
+        rail_preferences=RailPreferences(seat="Window", deck="Upper", special_meals=AWKWARD),
+        custom_fields=[CustomField(field_id="CF1", value=AWKWARD)],
+        unused_tickets=[UnusedTicket(ticket_number="T1", airline_code="AA", amount="10.50")],
+        southwest_unused_tickets=[UnusedTicket(ticket_number="T2", airline_code="WN")],
+        loyalty_programs=[
+            membership,
+            LoyaltyProgram(program_type=LoyaltyProgramType.HOTEL, vendor_code="MC", account_number="H1"),
+        ]
+    )
+
+
+class TestUpdateXmlWritersAgree(unittest.TestCase):
+    """to_update_xml and to_update_xml(legacy=True) build the same document"""
+    
+    def assert_writers_agree(self, profile, fields_to_update=None):
+        """Compare both writers in canonical form and return the string writer's document"""
+        new = profile.to_update_xml(fields_to_update)
+        legacy = profile.to_update_xml(fields_to_update, legacy=True)
+        self.assertEqual(canonical(new), canonical(legacy))
+        return new
+    
+    def test_full_profile_default_fields(self):
+        """Every non-empty section, with no explicit field list"""
+        self.assert_writers_agree(full_profile())
+    
+    def test_full_profile_every_field(self):
+        """Every section named explicitly, including General and HasNoPassport"""
+        fields = ["rule_class", "travel_config_id", "has_no_passport"] + [
+            name for name, _, _, _ in TravelProfile._SECTION_SCHEMA
+        ]
+        profile = full_profile()
+        profile.has_no_passport = True
+        xml = self.assert_writers_agree(profile, fields)
+        self.assertIn("<General>", xml)
+        self.assertIn("<HasNoPassport>true</HasNoPassport>", xml)
+    
+    def test_escaping(self):
+        """Markup characters in text and in the LoginId attribute are escaped alike"""
+        profile = full_profile(login_id='a&b"<c>@example.com')
+        xml = self.assert_writers_agree(profile, ["rule_class", "custom_fields", "discount_codes"])
+        root = etree.fromstring(xml.encode("utf-8"))
+        self.assertEqual(root.get("LoginId"), 'a&b"<c>@example.com')
+        self.assertEqual(root.findtext("General/RuleClass"), AWKWARD)
+    
+    def test_empty_lists(self):
+        """Requested list sections with no entries"""
+        profile = TravelProfile(login_id="traveler@example.com")
+        self.assert_writers_agree(
+            profile, ["national_ids", "passports", "visas", "custom_fields", "loyalty_programs"]
+        )
+    
+    def test_has_no_passport(self):
+        """HasNoPassport is only written when requested and set"""
+        profile = TravelProfile(login_id="traveler@example.com", has_no_passport=True)
+        xml = self.assert_writers_agree(profile, ["has_no_passport"])
+        self.assertIn("<HasNoPassport>true</HasNoPassport>", xml)
+        self.assertNotIn("HasNoPassport", self.assert_writers_agree(profile))
+        
+        profile.has_no_passport = False
+        self.assertNotIn("HasNoPassport", self.assert_writers_agree(profile, ["has_no_passport"]))
+    
+    def test_general_section(self):
+        """General holds RuleClass and TravelConfigID only when they are requested"""
+        profile = TravelProfile(login_id="traveler@example.com", travel_config_id="987")
+        xml = self.assert_writers_agree(profile, ["travel_config_id"])
+        root = etree.fromstring(xml.encode("utf-8"))
+        self.assertEqual(root.findtext("General/TravelConfigID"), "987")
+        self.assertIsNone(root.find("General/RuleClass"))
+        self.assertNotIn("<General>", self.assert_writers_agree(profile, ["air_preferences"]))
+
+
+if __name__ == "__main__":
+    unittest.main()